@@ -4,7 +4,8 @@ __author__ = 'Nick Ficano'
 __license__ = 'MIT License'
 __copyright__ = 'Copyright 2015 Nick Ficano'
 
-from .api import YouTube
+from .api import YouTube, ResolvedVideo
+from .playlist import Playlist
 
 # Set default logging handler to avoid "No handler found" warnings.
 import logging
@@ -3,20 +3,26 @@
 from __future__ import unicode_literals
 import json
 import logging
+import os
 import re
+import socket
+import threading
 import warnings
+import zlib
 try:
-    from urllib2 import urlopen
     from urlparse import urlparse, parse_qs, unquote
+    from urllib import urlencode
 except ImportError:
-    from urllib.parse import urlparse, parse_qs, unquote
-    from urllib.request import urlopen
+    from urllib.parse import urlparse, parse_qs, unquote, urlencode
 
 from .exceptions import MultipleObjectsReturned, PytubeError, CipherError, \
     DoesNotExist, AgeRestricted
-from .jsinterp import JSInterpreter
-from .models import Video
-from .utils import safe_filename
+from .jsinterp import JSInterpreter, ProfilingJSInterpreter
+from .models import Video, parse_quality
+from .request import HTTPException, SingleFlight, URLError, get, \
+    iter_text
+from .utils import safe_filename, extract_json, extract_json_stream, \
+    get_json_offset
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +46,31 @@ YT_QUALITY_PROFILES = {
     83: ["mp4", "240p", "H.264", "3D", "0.5", "AAC", "96"],
     84: ["mp4", "720p", "H.264", "3D", "2-2.9", "AAC", "152"],
     85: ["mp4", "1080p", "H.264", "3D", "2-2.9", "AAC", "152"],
+
+    # adaptive (DASH) mpeg4 video only
+    160: ["mp4", "144p", "H.264", "Main", "0.1", None, None],
+    133: ["mp4", "240p", "H.264", "Main", "0.2-0.3", None, None],
+    134: ["mp4", "360p", "H.264", "Main", "0.3-0.4", None, None],
+    135: ["mp4", "480p", "H.264", "Main", "0.5-1", None, None],
+    136: ["mp4", "720p", "H.264", "Main", "1-1.5", None, None],
+    137: ["mp4", "1080p", "H.264", "High", "2.5-3", None, None],
+    264: ["mp4", "1440p", "H.264", "High", "4-4.5", None, None],
+    266: ["mp4", "2160p", "H.264", "High", "12.5-16", None, None],
+
+    # adaptive (DASH) webm video only
+    242: ["webm", "240p", "VP9", "N/A", "0.1-0.2", None, None],
+    243: ["webm", "360p", "VP9", "N/A", "0.25", None, None],
+    244: ["webm", "480p", "VP9", "N/A", "0.5", None, None],
+    247: ["webm", "720p", "VP9", "N/A", "0.7-0.8", None, None],
+    248: ["webm", "1080p", "VP9", "N/A", "1.5", None, None],
+
+    # adaptive (DASH) audio only
+    140: ["m4a", None, None, None, None, "AAC", "128"],
+    141: ["m4a", None, None, None, None, "AAC", "256"],
+    171: ["webm", None, None, None, None, "Vorbis", "128"],
+    249: ["webm", None, None, None, None, "Opus", "50"],
+    250: ["webm", None, None, None, None, "Opus", "70"],
+    251: ["webm", None, None, None, None, "Opus", "160"],
 }
 
 # The keys corresponding to the quality/codec map above.
@@ -53,20 +84,53 @@ YT_QUALITY_PROFILE_KEYS = (
     'audio_bitrate'
 )
 
+# The numeric (resolution, video bitrate, audio bitrate) of each profile,
+# parsed once so selecting a stream is a plain comparison of tuples.
+YT_QUALITY_RANKS = dict(
+    (itag, parse_quality(profile[1], profile[4], profile[6]))
+    for itag, profile in YT_QUALITY_PROFILES.items())
+
+# The format version of ``YouTube.to_dict()`` and ``YouTube.to_bytes()``.
+SNAPSHOT_VERSION = 1
+
+# Coalesces the concurrent fetches of the same page or player script, e.g.:
+# many threads resolving videos at once all needing a new player script.
+_in_flight = SingleFlight()
+
+# The criteria accepted by ``YouTube.select()`` and the video attribute each
+# one is matched against.
+_EXACT_CRITERIA = ('extension', 'resolution', 'profile', 'video_codec',
+                   'audio_codec', 'adaptive', 'is_audio_only',
+                   'is_video_only')
+
 
 class YouTube(object):
     """Class representation of a single instance of a YouTube session.
     """
-    def __init__(self, url=None):
+    def __init__(self, url=None, retry_policy=None, video_info=False):
         """Initializes YouTube API wrapper.
 
         :param str url:
             The url to the YouTube video.
+        :param RetryPolicy retry_policy:
+            How to retry transient network errors, both while resolving and
+            downloading the videos (see ``pytube.request.RetryPolicy``).
+        :param bool video_info:
+            Whether to resolve the video from the compact video info endpoint
+            rather than the (much larger) watch page. The watch page is still
+            used when the video info is missing data (e.g.: the streams need
+            a signature deciphered by the player script).
         """
+        self.retry_policy = retry_policy
+        self.video_info = video_info
         self._filename = None
         self._video_url = None
         self._js_code = False
+        self._js_code_url = None
+        self._js_url = None
         self._videos = []
+        # Guards the lazily fetched player script.
+        self._lock = threading.Lock()
         if url:
             self.from_url(url)
 
@@ -129,14 +193,22 @@ class YouTube(object):
         # TODO: Check if the filename contains the file extension and either
         # strip it or raise an exception.
         self._filename = filename
-        if self.get_videos():
-            for video in self.get_videos():
-                video.filename = filename
+        # Including the adaptive streams, e.g.: for ``download_tracks()``.
+        for video in self.get_videos(adaptive=True):
+            video.filename = filename
         return True
 
-    def get_videos(self):
-        """Gets all videos."""
-        return self._videos
+    def get_videos(self, adaptive=False):
+        """Gets all videos.
+
+        :param bool adaptive:
+            Whether to include the adaptive (audio only and video only)
+            streams. By default only the streams with both audio and video are
+            returned.
+        """
+        if adaptive:
+            return self._videos
+        return [v for v in self._videos if not v.adaptive]
 
     @property
     def videos(self):
@@ -145,7 +217,7 @@ class YouTube(object):
         """
         warnings.warn("videos property deprecated. Use ``get_videos()`` "
                       "instead.", DeprecationWarning)
-        return self._videos
+        return self.get_videos()
 
     def from_url(self, url):
         """Sets the url for the video.
@@ -155,25 +227,28 @@ class YouTube(object):
         """
         self._video_url = url
 
-        # Reset the filename incase it was previously set.
-        self._filename = None
-
         # Get the video details.
         video_data = self.get_video_data()
 
-        # Set the title from the title.
-        self.title = video_data.get("args", {}).get("title")
+        # Get the title and the filename, which defaults to the title.
+        title = video_data.get("args", {}).get("title")
+        filename = safe_filename(title)
+        log.debug("generated 'safe' filename: %s", filename)
 
         # Rewrite and add the url to the javascript file, we'll need to fetch
         # this if YouTube doesn't provide us with the signature.
-        js_url = "http:" + video_data.get("assets", {}).get("js")
+        js_url = video_data.get("assets", {}).get("js")
+        if js_url:
+            js_url = "http:" + js_url
 
         # Just make these easily accessible as variables.
         stream_map = video_data.get("args", {}).get("stream_map")
         video_urls = stream_map.get("url")
 
         # For each video url, identify the quality profile and add it to list
-        # of available videos.
+        # of available videos. The list replaces the previous one at once, so
+        # resolving again doesn't duplicate the videos.
+        videos = []
         for idx, url in enumerate(video_urls):
             log.debug("attempting to get quality profile from url: %s", url)
             try:
@@ -192,7 +267,176 @@ class YouTube(object):
                           'cipher...')
                 signature = self._get_cipher(stream_map["s"][idx], js_url)
                 url = "{}&signature={}".format(url, signature)
-            self._add_video(url, self.filename, **quality_profile)
+            clen = stream_map["clen"][idx]
+            videos.append(self._create_video(
+                url, filename, fallback_host=stream_map["fallback_host"][idx],
+                itag=itag, quality=YT_QUALITY_RANKS[itag],
+                adaptive=stream_map["adaptive"][idx],
+                filesize=int(clen) if clen else None, **quality_profile))
+        videos.sort()
+        self.title = title
+        self._filename = filename
+        self._js_url = js_url
+        self._videos = videos
+
+    def snapshot(self):
+        """Gets an immutable ``ResolvedVideo`` of the current state, which
+        is safe to share between threads.
+        """
+        return ResolvedVideo(
+            self._video_url, self.video_id, getattr(self, 'title', None),
+            self._filename, self._js_url, self._videos)
+
+    def to_dict(self):
+        """Gets the resolved state (title, video id, player url and every
+        stream's signed url and profile) as a dictionary of plain values,
+        which ``from_dict()`` turns back into a ``YouTube`` instance without
+        any network access.
+        """
+        return {
+            'version': SNAPSHOT_VERSION,
+            'url': self._video_url,
+            'video_id': self.video_id,
+            'title': getattr(self, 'title', None),
+            'filename': self._filename,
+            'js_url': self._js_url,
+            'videos': [v.to_dict() for v in self._videos],
+        }
+
+    @classmethod
+    def from_dict(cls, data, retry_policy=None):
+        """Creates a resolved instance from the dictionary returned by
+        ``to_dict()``.
+
+        :param dict data:
+            The resolved state.
+        :param RetryPolicy retry_policy:
+            How to retry transient network errors.
+        """
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise PytubeError("Unsupported snapshot version: {}".format(
+                data.get('version')))
+        yt = cls(retry_policy=retry_policy)
+        yt._video_url = data['url']
+        yt.title = data['title']
+        yt._filename = data['filename']
+        yt._js_url = data['js_url']
+        yt._videos = sorted(Video.from_dict(v, retry_policy=retry_policy)
+                            for v in data['videos'])
+        return yt
+
+    def to_bytes(self):
+        """Gets the resolved state in a compact binary form: a version byte
+        followed by the zlib compressed json of ``to_dict()``.
+        """
+        data = json.dumps(self.to_dict(), separators=(',', ':'))
+        return bytes(bytearray([SNAPSHOT_VERSION]) +
+                     zlib.compress(data.encode('utf-8')))
+
+    @classmethod
+    def from_bytes(cls, data, retry_policy=None):
+        """Creates a resolved instance from the output of ``to_bytes()``.
+
+        :param bytes data:
+            The resolved state.
+        :param RetryPolicy retry_policy:
+            How to retry transient network errors.
+        """
+        data = bytearray(data)
+        if not data or data[0] != SNAPSHOT_VERSION:
+            raise PytubeError("Unsupported snapshot version: {}".format(
+                data[0] if data else None))
+        try:
+            state = json.loads(zlib.decompress(bytes(data[1:])).decode(
+                'utf-8'))
+        except (zlib.error, ValueError) as e:
+            raise PytubeError("Invalid snapshot: {}".format(e))
+        return cls.from_dict(state, retry_policy=retry_policy)
+
+    def probe_sizes(self, workers=8, adaptive=True):
+        """Gets the size in bytes of every video without downloading them,
+        probing the streams concurrently. Sizes already known from the stream
+        map (``clen``) or a previous probe aren't requested again. Each size is
+        cached on the video as ``filesize``; returns a dictionary of itag to
+        size (``None`` if the server didn't tell).
+
+        :param int workers:
+            The number of concurrent requests.
+        :param bool adaptive:
+            Whether to include the adaptive (audio only and video only)
+            streams.
+        """
+        videos = self.get_videos(adaptive=adaptive)
+        pending = [v for v in videos if v.filesize is None]
+        lock = threading.Lock()
+        errors = []
+
+        def probe():
+            while True:
+                with lock:
+                    if not pending or errors:
+                        return
+                    video = pending.pop()
+                try:
+                    video.probe_size()
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=probe)
+                   for _ in range(min(workers, len(pending)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return dict((v.itag, v.filesize) for v in videos)
+
+    def download_tracks(self, path='', audio=None, video=None, **kwargs):
+        """Downloads the audio and the video tracks of the adaptive streams
+        concurrently, as separate files. Returns the ``DownloadResult`` of
+        the audio and of the video track.
+
+        :param str path:
+            The destination output directory, or a file path to which the
+            kind of the track is appended (``out.mp4`` is saved as
+            ``out.audio.webm`` and ``out.video.mp4``).
+        :param Video audio:
+            The audio track, the best audio only stream by default.
+        :param Video video:
+            The video track, the best video only stream by default.
+        :param kwargs:
+            Additional arguments passed to ``Video.download``.
+        """
+        audio = audio or self.select({'is_audio_only': True})
+        video = video or self.select({'is_video_only': True})
+        results = [None, None]
+        errors = []
+
+        def download(idx, track, kind):
+            # Both tracks must never be written to the same file.
+            if os.path.isdir(path or '.'):
+                dst = os.path.join(path, "{}.{}.{}".format(
+                    track.filename, kind, track.extension))
+            else:
+                dst = "{}.{}.{}".format(
+                    os.path.splitext(path)[0], kind, track.extension)
+            try:
+                results[idx] = track.download(dst, **kwargs)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=download, args=(0, audio, 'audio')),
+            threading.Thread(target=download, args=(1, video, 'video')),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return tuple(results)
 
     def get(self, extension=None, resolution=None, profile=None):
         """Gets a single video given a file extention (and/or resolution
@@ -248,30 +492,114 @@ class YouTube(object):
                 results.append(v)
         return results
 
+    def select(self, *preferences):
+        """Selects the best video given a ranked list of preferences, in a
+        single pass over the videos. The first preference that any video
+        satisfies wins; among the videos satisfying it, the one with the
+        highest resolution (then video and audio bitrate) is returned.
+
+        Each preference is a dictionary of criteria:
+
+        - ``extension``, ``resolution``, ``profile``, ``video_codec`` and
+          ``audio_codec`` must match exactly.
+        - ``min_resolution`` and ``max_resolution`` bound the resolution
+          (e.g.: 720 or "720p").
+        - ``max_video_bitrate`` bounds the video bitrate in Mbit/s.
+        - ``max_filesize`` bounds the size in bytes; videos of unknown size
+          don't match, so call ``probe_sizes()`` first.
+        - ``is_audio_only`` and ``is_video_only`` select the adaptive audio
+          or video tracks; ``adaptive`` selects any adaptive stream. Unless
+          one of them is given, only streams with both audio and video match.
+        - ``prefer`` is either "highest" (the default) or "lowest".
+
+        For example, the best mp4 up to 720p, else the best of any kind::
+
+            yt.select({'extension': 'mp4', 'max_resolution': 720}, {})
+
+        :param dict preferences:
+            The criteria, from most to least preferred. With no preferences
+            the best video overall is returned.
+        """
+        return select_video(self.get_videos(adaptive=True), *preferences)
+
     def get_video_data(self):
         """Gets the page and extracts out the video data."""
-        # Reset the filename incase it was previously set.
-        self.title = None
-        response = urlopen(self.url)
-        if not response:
-            raise PytubeError("Unable to open url: {}".format(self.url))
-
-        html = response.read().decode("utf-8")
-        if "og:restrictions:age" in html:
-            raise AgeRestricted("Age restricted video. Unable to download "
-                                "without being signed in.")
-
-        # Extract out the json data from the html response body.
-        json_object = self._get_json_data(html)
+        json_object = None
+        if self.video_info:
+            json_object = _in_flight.call(('video_info', self.url),
+                                          self._get_video_info)
+        if json_object is None:
+            html, json_object = _in_flight.call(('watch', self.url),
+                                                self._get_page_data)
+            if "og:restrictions:age" in html:
+                raise AgeRestricted("Age restricted video. Unable to "
+                                    "download without being signed in.")
+            if json_object is None:
+                raise PytubeError("Unable to find the player config in "
+                                  "page.")
+
+        # The json object may be shared with concurrent lookups of the same
+        # video, copy what's modified below.
+        json_object = dict(json_object, args=dict(json_object["args"]))
 
         # Here we decode the stream map and bundle it into the json object. We
         # do this just so we just can return one object for the video data.
         encoded_stream_map = json_object.get("args", {}).get(
             "url_encoded_fmt_stream_map")
-        json_object['args']['stream_map'] = self._parse_stream_map(
-            encoded_stream_map)
+        stream_map = self._parse_stream_map(encoded_stream_map)
+
+        # The adaptive streams (audio only or video only) come in a separate
+        # map with the same encoding, append them to the same stream records.
+        adaptive_map = self._parse_stream_map(
+            json_object["args"].get("adaptive_fmts"))
+        stream_map["adaptive"] = [False] * len(stream_map["url"]) + \
+            [True] * len(adaptive_map["url"])
+        for key, values in adaptive_map.items():
+            stream_map[key].extend(values)
+        json_object['args']['stream_map'] = stream_map
         return json_object
 
+    def _get_page_data(self):
+        """Gets the watch page up to the end of the player config, and the
+        config (``None`` if it isn't in the page).
+        """
+        return extract_json_stream(
+            iter_text(self.url, retry_policy=self.retry_policy),
+            "ytplayer.config = ")
+
+    def _get_video_info(self):
+        """Gets the video data from the video info endpoint, in the same
+        shape as the player config of the watch page. Returns ``None`` if the
+        endpoint is unavailable or can't describe the video on its own, so
+        the watch page is used instead.
+        """
+        if not self.video_id:
+            return None
+        parts = urlparse(self.url)
+        url = "{}://{}/get_video_info?{}".format(
+            parts.scheme, parts.netloc, urlencode({'video_id': self.video_id}))
+        try:
+            info = get(url, retry_policy=self.retry_policy)
+        except (URLError, HTTPException, socket.error, PytubeError) as e:
+            log.warning("video info unavailable, using the watch page: %s",
+                        e)
+            return None
+        args = dict((k, v[0]) for k, v in parse_qs(
+            info, keep_blank_values=True).items())
+        if args.get("status") != "ok":
+            log.debug("video info failed: %s", args.get("reason"))
+            return None
+        if not args.get("url_encoded_fmt_stream_map"):
+            return None
+        # The video info doesn't point to the player script, so ciphered
+        # signatures can only be resolved from the watch page.
+        for key in ("url_encoded_fmt_stream_map", "adaptive_fmts"):
+            if any(kv.startswith("s=") for kv in re.split(
+                    "[&,]", args.get(key, ""))):
+                log.debug("video info has ciphered streams")
+                return None
+        return {"args": args, "assets": {}}
+
     def _parse_stream_map(self, blob):
         """A modified version of ``urlparse.parse_qs`` that's able to decode
         YouTube's stream map.
@@ -285,9 +613,13 @@ class YouTube(object):
             "quality": [],
             "fallback_host": [],
             "s": [],
-            "type": []
+            "type": [],
+            "clen": []
         }
 
+        if not blob:
+            return dct
+
         # Split the comma separated videos.
         videos = blob.split(",")
 
@@ -295,11 +627,13 @@ class YouTube(object):
         videos = [video.split("&") for video in videos]
 
         # Split at the equals sign so we can break this key value pairs and
-        # toss it into a dictionary.
+        # toss it into a dictionary. Keys missing from a video are filled with
+        # ``None`` so every list stays aligned with the video's index.
         for video in videos:
-            for kv in video:
-                key, value = kv.split("=")
-                dct.get(key, []).append(unquote(value))
+            params = dict(kv.split("=", 1) for kv in video if "=" in kv)
+            for key, values in dct.items():
+                value = params.get(key)
+                values.append(unquote(value) if value is not None else None)
         log.debug('decoded stream map: %s', dct)
         return dct
 
@@ -309,14 +643,7 @@ class YouTube(object):
         :param str html:
             The raw html of the page.
         """
-        # 18 represents the length of "ytplayer.config = ".
-        start = html.find("ytplayer.config = ") + 18
-        html = html[start:]
-
-        offset = self._get_json_offset(html)
-        if not offset:
-            raise PytubeError("Unable to extract json.")
-        return json.loads(html[:offset])
+        return extract_json(html, "ytplayer.config = ")
 
     def _get_json_offset(self, html):
         """Find where the json object starts.
@@ -324,42 +651,59 @@ class YouTube(object):
         :param str html:
             The raw html of the YouTube page.
         """
-        brackets = []
-        index = 1
-        # Determine the offset by pushing/popping brackets until all
-        # js expressions are closed.
-        for idx, ch in enumerate(html):
-            if ch == "{":
-                brackets.append("}")
-            elif ch == "}":
-                brackets.pop()
-                if len(brackets) == 0:
-                    break
-        else:
-            raise PytubeError("Unable to determine json offset.")
-        return index + idx
+        return get_json_offset(html)
+
+    def profile_cipher(self, signature, trace=False):
+        """Deciphers a signature with a ``ProfilingJSInterpreter``, to see
+        what the interpreter does with the player script (e.g.: after a
+        player update made deciphering slow or broken). Returns the
+        deciphered signature (``None`` if deciphering failed, the error is
+        logged) and the interpreter, see its ``report()`` and
+        ``format_trace()``.
+
+        :param str signature:
+            The scrambled signature (the ``s`` parameter of a stream).
+        :param bool trace:
+            Whether to record every expression evaluated.
+        """
+        if not self._js_url:
+            raise PytubeError("No player script to profile.")
+        interpreters = []
+
+        def interpreter(code):
+            interpreters.append(ProfilingJSInterpreter(code, trace=trace))
+            return interpreters[-1]
+        try:
+            result = self._get_cipher(signature, self._js_url, interpreter)
+        except CipherError as e:
+            log.warning("%s", e)
+            result = None
+        return result, interpreters[-1] if interpreters else None
 
-    def _get_cipher(self, signature, url):
+    def _get_cipher(self, signature, url, interpreter=JSInterpreter):
         """Gets the signature using the cipher.
 
         :param str signature:
             The url signature.
         :param str url:
             The url of the javascript file.
+        :param interpreter:
+            Creates the javascript interpreter given the code.
         """
         reg_exp = re.compile(r'\.sig\|\|([a-zA-Z0-9$]+)\(')
-        if not self._js_code:
-            response = urlopen(url)
-            if not response:
-                raise PytubeError("Unable to open url: {}".format(self.url))
-            self._js_code = response.read().decode("utf-8")
+        with self._lock:
+            if not self._js_code or self._js_code_url != url:
+                self._js_code = _in_flight.call(
+                    ('js', url), get, url, retry_policy=self.retry_policy)
+                self._js_code_url = url
+            js_code = self._js_code
         try:
-            matches = reg_exp.search(self._js_code)
+            matches = reg_exp.search(js_code)
             if matches:
                 # Return the first matching group.
                 func = next(g for g in matches.groups() if g is not None)
             # Load js into JS Python interpreter.
-            jsi = JSInterpreter(self._js_code)
+            jsi = interpreter(js_code)
             initial_function = jsi.extract_function(func)
             return initial_function([signature])
         except Exception as e:
@@ -406,7 +750,198 @@ class YouTube(object):
         :param kwargs:
             Additional properties to set for the video object.
         """
-        video = Video(url, filename, **kwargs)
-        self._videos.append(video)
-        self._videos.sort()
+        video = self._create_video(url, filename, **kwargs)
+        self._videos = sorted(self._videos + [video])
         return True
+
+    def _create_video(self, url, filename, **kwargs):
+        """Creates a video object with the instance's defaults.
+
+        :param str url:
+            The signed url to the video.
+        :param str filename:
+            The filename for the video.
+        :param kwargs:
+            Additional properties to set for the video object.
+        """
+        kwargs.setdefault('retry_policy', self.retry_policy)
+        return Video(url, filename, **kwargs)
+
+
+class ResolvedVideo(object):
+    """An immutable snapshot of a resolved video: its url, ids, title and a
+    tuple of its videos (streams), which are frozen (see ``Video.freeze()``).
+    It can be shared between threads, and variants (e.g.: with another
+    filename) are derived as new snapshots rather than by modifying it.
+    """
+    __slots__ = ('url', 'video_id', 'title', 'filename', 'js_url', 'videos')
+
+    def __init__(self, url, video_id, title, filename, js_url, videos):
+        """Sets-up the snapshot.
+
+        :param str url:
+            The url to the YouTube video.
+        :param str video_id:
+            The id of the video.
+        :param str title:
+            The title of the video.
+        :param str filename:
+            The filename (minus the extension) of the videos.
+        :param str js_url:
+            The url of the player script.
+        :param videos:
+            The ``Video`` objects, frozen copies are kept.
+        """
+        videos = tuple(sorted(v if v.frozen else v.freeze() for v in videos))
+        for name, value in zip(self.__slots__, (
+                url, video_id, title, filename, js_url, videos)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResolvedVideo is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ResolvedVideo is immutable")
+
+    def __reduce__(self):
+        # Copies and pickles are rebuilt through ``__init__``, as the slots
+        # can't be assigned.
+        return (ResolvedVideo, tuple(getattr(self, name)
+                                     for name in self.__slots__))
+
+    def to_dict(self):
+        """Gets the snapshot as a dictionary of plain values, in the format
+        of ``YouTube.to_dict()``, so either class can load it back.
+        """
+        return {
+            'version': SNAPSHOT_VERSION,
+            'url': self.url,
+            'video_id': self.video_id,
+            'title': self.title,
+            'filename': self.filename,
+            'js_url': self.js_url,
+            'videos': [v.to_dict() for v in self.videos],
+        }
+
+    @classmethod
+    def from_dict(cls, data, retry_policy=None):
+        """Creates a snapshot from the dictionary returned by ``to_dict()``
+        (of this class or of ``YouTube``).
+
+        :param dict data:
+            The resolved state.
+        :param RetryPolicy retry_policy:
+            The default retry policy for downloads.
+        """
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise PytubeError("Unsupported snapshot version: {}".format(
+                data.get('version')))
+        return cls(data['url'], data['video_id'], data['title'],
+                   data['filename'], data['js_url'],
+                   [Video.from_dict(v, retry_policy=retry_policy)
+                    for v in data['videos']])
+
+    def with_filename(self, filename):
+        """Gets a copy of the snapshot saving the videos to another filename.
+
+        :param str filename:
+            The filename (minus the extension) of the videos.
+        """
+        return ResolvedVideo(self.url, self.video_id, self.title, filename,
+                             self.js_url,
+                             [v.with_filename(filename) for v in self.videos])
+
+    def get_videos(self, adaptive=False):
+        """Gets all videos, see ``YouTube.get_videos()``.
+
+        :param bool adaptive:
+            Whether to include the adaptive (audio only and video only)
+            streams.
+        """
+        if adaptive:
+            return self.videos
+        return tuple(v for v in self.videos if not v.adaptive)
+
+    def select(self, *preferences):
+        """Selects the best video given a ranked list of preferences, see
+        ``YouTube.select()``.
+
+        :param dict preferences:
+            The criteria, from most to least preferred.
+        """
+        return select_video(self.videos, *preferences)
+
+    def __repr__(self):
+        return "<ResolvedVideo: {} ({} videos)>".format(
+            self.video_id, len(self.videos))
+
+
+def select_video(videos, *preferences):
+    """Selects the best of ``videos`` given a ranked list of preferences, see
+    ``YouTube.select()``.
+
+    :param videos:
+        The videos to select from.
+    :param dict preferences:
+        The criteria, from most to least preferred.
+    """
+    preferences = [dict(p) for p in preferences] or [{}]
+    for preference in preferences:
+        if not any(key in preference for key in (
+                'adaptive', 'is_audio_only', 'is_video_only')):
+            preference['adaptive'] = False
+        for key in ('min_resolution', 'max_resolution'):
+            if key in preference:
+                preference[key] = parse_quality(
+                    preference[key], None, None)[0]
+    best, best_key = None, None
+    for video in videos:
+        for rank, preference in enumerate(preferences):
+            if _match_preference(video, preference):
+                break
+        else:
+            continue
+        # Audio tracks have no resolution, so they are ranked by bitrate.
+        quality = tuple(v or 0 for v in video.quality)
+        if preference.get('prefer', 'highest') == 'lowest':
+            quality = tuple(-v for v in quality)
+        key = (-rank, quality)
+        if best_key is None or key > best_key:
+            best, best_key = video, key
+    if best is None:
+        raise DoesNotExist("No videos met this criteria.")
+    return best
+
+
+def _match_preference(video, preference):
+    """Whether a video satisfies all criteria of a ``select()`` preference.
+
+    :param Video video:
+        The video to check.
+    :param dict preference:
+        The criteria, with resolutions already parsed to numbers.
+    """
+    for key, value in preference.items():
+        if key in _EXACT_CRITERIA:
+            if getattr(video, key) != value:
+                return False
+        elif key == 'min_resolution':
+            if (video.resolution_value or 0) < value:
+                return False
+        elif key == 'max_resolution':
+            if video.resolution_value is None or \
+                    video.resolution_value > value:
+                return False
+        elif key == 'max_video_bitrate':
+            if video.video_bitrate_value is None or \
+                    video.video_bitrate_value > value:
+                return False
+        elif key == 'max_filesize':
+            if video.filesize is None or video.filesize > value:
+                return False
+        elif key == 'prefer':
+            if value not in ('highest', 'lowest'):
+                raise ValueError("Unknown preference order: {}".format(value))
+        else:
+            raise TypeError("Unknown selection criteria: {}".format(key))
+    return True
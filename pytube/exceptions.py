@@ -26,3 +26,15 @@ class AgeRestricted(Exception):
     """The requested video has an age restriction.
     """
     pass
+
+
+class IncompleteDownload(PytubeError):
+    """The number of bytes received doesn't match the expected file size.
+    """
+    pass
+
+
+class ChecksumMismatch(PytubeError):
+    """The checksum of the downloaded file doesn't match the expected one.
+    """
+    pass
@@ -3,6 +3,9 @@ from __future__ import unicode_literals
 import json
 import operator
 import re
+import sys
+
+from .utils import monotonic
 
 _OPERATORS = [
     ('|', operator.or_),
@@ -23,6 +26,10 @@ _NAME_RE = r'[a-zA-Z_$][a-zA-Z_$0-9]*'
 
 
 class JSInterpreter(object):
+    # The regular expression module, replaced by ``ProfilingJSInterpreter``
+    # to count the matches tried.
+    _re = re
+
     def __init__(self, code, objects=None):
         if objects is None:
             objects = {}
@@ -36,11 +43,11 @@ class JSInterpreter(object):
 
         should_abort = False
         stmt = stmt.lstrip()
-        stmt_m = re.match(r'var\s', stmt)
+        stmt_m = self._re.match(r'var\s', stmt)
         if stmt_m:
             expr = stmt[len(stmt_m.group(0)):]
         else:
-            return_m = re.match(r'return(?:\s+|$)', stmt)
+            return_m = self._re.match(r'return(?:\s+|$)', stmt)
             if return_m:
                 expr = stmt[len(return_m.group(0)):]
                 should_abort = True
@@ -59,7 +66,7 @@ class JSInterpreter(object):
 
         if expr.startswith('('):
             parens_count = 0
-            for m in re.finditer(r'[()]', expr):
+            for m in self._re.finditer(r'[()]', expr):
                 if m.group(0) == '(':
                     parens_count += 1
                 else:
@@ -78,7 +85,7 @@ class JSInterpreter(object):
                 raise Exception('Premature end of parens in %r' % expr)
 
         for op, opfunc in _ASSIGN_OPERATORS:
-            m = re.match(r'''(?x)
+            m = self._re.match(r'''(?x)
                 (?P<out>%s)(?:\[(?P<index>[^\]]+?)\])?
                 \s*%s
                 (?P<expr>.*)$''' % (_NAME_RE, re.escape(op)), expr)
@@ -105,7 +112,7 @@ class JSInterpreter(object):
         if expr.isdigit():
             return int(expr)
 
-        var_m = re.match(
+        var_m = self._re.match(
             r'(?!if|return|true|false)(?P<name>%s)$' % _NAME_RE,
             expr)
         if var_m:
@@ -116,7 +123,7 @@ class JSInterpreter(object):
         except ValueError:
             pass
 
-        m = re.match(
+        m = self._re.match(
             r'(?P<var>%s)\.(?P<member>[^(]+)(?:\(+(?P<args>[^()]*)\))?$' % _NAME_RE,
             expr)
         if m:
@@ -169,7 +176,7 @@ class JSInterpreter(object):
 
             return obj[member](argvals)
 
-        m = re.match(
+        m = self._re.match(
             r'(?P<in>%s)\[(?P<idx>.+)\]$' % _NAME_RE, expr)
         if m:
             val = local_vars[m.group('in')]
@@ -178,7 +185,7 @@ class JSInterpreter(object):
             return val[idx]
 
         for op, opfunc in _OPERATORS:
-            m = re.match(r'(?P<x>.+?)%s(?P<y>.+)' % re.escape(op), expr)
+            m = self._re.match(r'(?P<x>.+?)%s(?P<y>.+)' % re.escape(op), expr)
             if not m:
                 continue
             x, abort = self.interpret_statement(
@@ -193,7 +200,7 @@ class JSInterpreter(object):
                     'Premature right-side return of %s in %r' % (op, expr))
             return opfunc(x, y)
 
-        m = re.match(
+        m = self._re.match(
             r'^(?P<func>%s)\((?P<args>[a-zA-Z0-9_$,]+)\)$' % _NAME_RE, expr)
         if m:
             fname = m.group('func')
@@ -208,14 +215,14 @@ class JSInterpreter(object):
 
     def extract_object(self, objname):
         obj = {}
-        obj_m = re.search(
+        obj_m = self._re.search(
             (r'(?:var\s+)?%s\s*=\s*\{' % re.escape(objname)) +
             r'\s*(?P<fields>([a-zA-Z$0-9]+\s*:\s*function\(.*?\)\s*\{.*?\})*)' +
             r'\}\s*;',
             self.code)
         fields = obj_m.group('fields')
         # Currently, it only supports function definitions
-        fields_m = re.finditer(
+        fields_m = self._re.finditer(
             r'(?P<key>[a-zA-Z$0-9]+)\s*:\s*function'
             r'\((?P<args>[a-z,]+)\){(?P<code>[^}]+)}',
             fields)
@@ -226,7 +233,7 @@ class JSInterpreter(object):
         return obj
 
     def extract_function(self, funcname):
-        func_m = re.search(
+        func_m = self._re.search(
             r'''(?x)
                 (?:function\s+%s|[{;]%s\s*=\s*function)\s*
                 \((?P<args>[^)]*)\)\s*
@@ -252,3 +259,135 @@ class JSInterpreter(object):
                     break
             return res
         return resf
+
+
+class ProfilingJSInterpreter(JSInterpreter):
+    """A ``JSInterpreter`` recording what it does, to find slow or broken
+    expressions in a new player script. It counts the statements and
+    expressions interpreted, the regular expression matches tried (and
+    succeeded) at each branch of the interpreter, the deepest nesting of
+    expressions and the calls and time spent in each extracted function, and
+    can record a trace of every expression evaluated.
+
+    The plain ``JSInterpreter`` does none of this, so it costs nothing
+    unless this class is used instead.
+    """
+    def __init__(self, code, objects=None, trace=False):
+        """Sets-up the interpreter.
+
+        :param str code:
+            The javascript code.
+        :param dict objects:
+            The objects already extracted from the code.
+        :param bool trace:
+            Whether to record every expression evaluated and its result.
+        """
+        super(ProfilingJSInterpreter, self).__init__(code, objects)
+        self._re = _CountingRe(self)
+        self.statements = 0
+        self.expressions = 0
+        self.depth = 0
+        self.max_depth = 0
+        # The ``[tries, matches]`` of each call site, by label.
+        self.matches = {}
+        # The ``[calls, seconds]`` of each extracted function, by name.
+        self.functions = {}
+        self.trace = [] if trace else None
+
+    def interpret_statement(self, stmt, local_vars, allow_recursion=100):
+        self.statements += 1
+        return super(ProfilingJSInterpreter, self).interpret_statement(
+            stmt, local_vars, allow_recursion)
+
+    def interpret_expression(self, expr, local_vars, allow_recursion):
+        self.expressions += 1
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        try:
+            result = super(ProfilingJSInterpreter, self).interpret_expression(
+                expr, local_vars, allow_recursion)
+        finally:
+            self.depth -= 1
+        if self.trace is not None:
+            # Recorded once evaluated, so inner expressions come first.
+            self.trace.append((self.depth, expr.strip(), repr(result)))
+        return result
+
+    def extract_object(self, objname):
+        obj = super(ProfilingJSInterpreter, self).extract_object(objname)
+        return dict((key, self._timed('{}.{}'.format(objname, key), func))
+                    for key, func in obj.items())
+
+    def extract_function(self, funcname):
+        return self._timed(funcname, super(
+            ProfilingJSInterpreter, self).extract_function(funcname))
+
+    def report(self):
+        """Gets the recorded counts and timings as human readable text, the
+        costliest first.
+        """
+        lines = ['{} statements, {} expressions, max depth {}'.format(
+            self.statements, self.expressions, self.max_depth)]
+        lines.append('functions (calls, total ms):')
+        for name, (calls, seconds) in sorted(
+                self.functions.items(), key=lambda i: -i[1][1]):
+            lines.append('  {:<24} {:>6} {:>10.3f}'.format(
+                name, calls, seconds * 1000))
+        lines.append('regex matches (tried, matched):')
+        for label, (tries, matched) in sorted(
+                self.matches.items(), key=lambda i: -i[1][0]):
+            lines.append('  {:<56} {:>6} {:>6}'.format(
+                label, tries, matched))
+        return '\n'.join(lines)
+
+    def format_trace(self):
+        """Gets the recorded trace as text, indented by nesting depth."""
+        if self.trace is None:
+            raise ValueError("Tracing isn't enabled")
+        return '\n'.join('{}{} => {}'.format('  ' * depth, expr, result)
+                         for depth, expr, result in self.trace)
+
+    def _timed(self, name, func):
+        """Wraps an extracted function to record its calls and time."""
+        stats = self.functions.setdefault(name, [0, 0.0])
+
+        def timed(args):
+            started = monotonic()
+            try:
+                return func(args)
+            finally:
+                stats[0] += 1
+                stats[1] += monotonic() - started
+        return timed
+
+
+class _CountingRe(object):
+    """Stands in for the ``re`` module in a ``ProfilingJSInterpreter``,
+    counting the matches tried by each call site of the interpreter.
+    """
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+
+    def match(self, pattern, string, flags=0):
+        return self._count(pattern, re.match(pattern, string, flags))
+
+    def search(self, pattern, string, flags=0):
+        return self._count(pattern, re.search(pattern, string, flags))
+
+    def finditer(self, pattern, string, flags=0):
+        self._count(pattern, True)
+        return re.finditer(pattern, string, flags)
+
+    def __getattr__(self, name):
+        return getattr(re, name)
+
+    def _count(self, pattern, result):
+        """Records a match tried by the caller of the calling method."""
+        caller = sys._getframe(2)
+        label = '{}:{} {}'.format(
+            caller.f_code.co_name, caller.f_lineno,
+            ' '.join(pattern.split())[:32])
+        stats = self._interpreter.matches.setdefault(label, [0, 0])
+        stats[0] += 1
+        stats[1] += bool(result)
+        return result
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""A load driver running concurrent ``YouTube(url)`` + ``Video.download``
+jobs, by default against a local :class:`~pytube.standin.StandInServer`, and
+reporting lookups per second, throughput and latency percentiles.
+
+    python -m pytube.loadtest --jobs 200 --concurrency 16 --latency 0.05
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import contextlib
+import json
+import logging
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from .api import YouTube
+from .models import Video
+from .request import RetryPolicy
+from .standin import StandInServer, StandInVideo
+from .utils import monotonic
+
+log = logging.getLogger(__name__)
+
+
+def percentile(values, pct):
+    """Gets the ``pct`` percentile (0-100) of a list of values, using the
+    nearest-rank method.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(int(math.ceil(pct / 100. * len(values))) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+class SlowFile(object):
+    """Wraps a file, sleeping on every write to simulate a stalled disk
+    (e.g.: a busy NFS mount).
+    """
+    def __init__(self, fileobj, latency):
+        """Sets-up the wrapper.
+
+        :param fileobj:
+            The file to wrap.
+        :param float latency:
+            The delay in seconds added to every write.
+        """
+        self._file = fileobj
+        self.latency = latency
+
+    def write(self, data):
+        time.sleep(self.latency)
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.close()
+
+
+@contextlib.contextmanager
+def slow_disk(latency):
+    """Makes every ``Video.download`` write through a :class:`SlowFile` for
+    the duration of the context.
+
+    :param float latency:
+        The delay in seconds added to every write.
+    """
+    if not latency:
+        yield
+        return
+    open_file = Video._open_file
+
+    def slow_open_file(video, path):
+        return SlowFile(open_file(video, path), latency)
+    Video._open_file = slow_open_file
+    try:
+        yield
+    finally:
+        Video._open_file = open_file
+
+
+class LoadReport(object):
+    """The measurements of a load test run."""
+    def __init__(self):
+        self.lookups = []
+        self.jobs = []
+        self.bytes_received = 0
+        self.errors = []
+        self.elapsed = 0
+        self._lock = threading.Lock()
+
+    def record(self, lookup, job=None, bytes_received=0, error=None):
+        """Records the outcome of a single job.
+
+        :param float lookup:
+            The seconds taken by ``YouTube(url)``.
+        :param float job:
+            The seconds taken by the whole job, ``None`` if it failed.
+        :param int bytes_received:
+            The number of bytes downloaded.
+        :param Exception error:
+            The error the job failed with.
+        """
+        with self._lock:
+            if lookup is not None:
+                self.lookups.append(lookup)
+            if job is not None:
+                self.jobs.append(job)
+            self.bytes_received += bytes_received
+            if error is not None:
+                self.errors.append(error)
+
+    def summary(self):
+        """Gets the report as a dictionary."""
+        elapsed = self.elapsed or float('nan')
+        return {
+            'jobs': len(self.jobs),
+            'errors': len(self.errors),
+            'elapsed': self.elapsed,
+            'lookups_per_sec': len(self.lookups) / elapsed,
+            'mb_per_sec': self.bytes_received / 1024. / 1024. / elapsed,
+            'bytes_received': self.bytes_received,
+            'lookup_latency': dict(
+                ('p%d' % p, percentile(self.lookups, p))
+                for p in (50, 90, 99)),
+            'job_latency': dict(
+                ('p%d' % p, percentile(self.jobs, p)) for p in (50, 90, 99)),
+        }
+
+    def format(self):
+        """Gets the report as human readable text."""
+        s = self.summary()
+
+        def ms(value):
+            return '-' if value is None else '{:.1f}ms'.format(value * 1000)
+        lines = [
+            '{jobs} jobs, {errors} errors in {elapsed:.2f}s'.format(**s),
+            'lookups/sec: {:.2f}'.format(s['lookups_per_sec']),
+            'MB/s:        {:.2f}'.format(s['mb_per_sec']),
+        ]
+        for name in ('lookup_latency', 'job_latency'):
+            lines.append('{:<12} {}'.format(
+                name.split('_')[0] + ':', '  '.join(
+                    '{} {}'.format(p, ms(s[name][p]))
+                    for p in ('p50', 'p90', 'p99'))))
+        return '\n'.join(lines)
+
+
+def run(urls, jobs, concurrency=4, download=True, select=None,
+        retry_policy=None, disk_latency=0, video_info=False,
+        **download_kwargs):
+    """Runs ``jobs`` resolve (and download) jobs over ``urls`` round-robin,
+    ``concurrency`` at a time, and returns a :class:`LoadReport`.
+
+    :param list urls:
+        The watch urls to resolve.
+    :param int jobs:
+        The total number of jobs.
+    :param int concurrency:
+        The number of jobs run concurrently.
+    :param bool download:
+        Whether to download a stream after resolving the video.
+    :param func select:
+        Picks the ``Video`` to download given a ``YouTube`` instance.
+        Defaults to ``YouTube.select()``.
+    :param RetryPolicy retry_policy:
+        The retry policy of the jobs.
+    :param float disk_latency:
+        The delay in seconds added to every write to disk.
+    :param bool video_info:
+        Whether to resolve the videos from the video info endpoint.
+    :param download_kwargs:
+        Additional arguments passed to ``Video.download``.
+    """
+    select = select or (lambda yt: yt.select())
+    report = LoadReport()
+    counter = iter(range(jobs))
+    counter_lock = threading.Lock()
+    path = tempfile.mkdtemp(prefix='pytube-loadtest-')
+
+    def worker():
+        while True:
+            with counter_lock:
+                job = next(counter, None)
+            if job is None:
+                return
+            began = monotonic()
+            lookup = None
+            try:
+                yt = YouTube(urls[job % len(urls)], retry_policy=retry_policy,
+                             video_info=video_info)
+                lookup = monotonic() - began
+                received = 0
+                if download:
+                    video = select(yt)
+                    video.filename = '{}-{}'.format(video.filename, job)
+                    result = video.download(path, **download_kwargs)
+                    received = result.bytes_received
+                    os.remove(result.path)
+                report.record(lookup, monotonic() - began, received)
+            except Exception as e:
+                log.exception("job %d failed", job)
+                report.record(lookup, error=e)
+
+    began = monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    try:
+        with slow_disk(disk_latency):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        report.elapsed = monotonic() - began
+        shutil.rmtree(path, ignore_errors=True)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=(
+        'Load test pytube against a local stand-in server or real urls.'))
+    parser.add_argument('urls', nargs='*', help=(
+        'Watch urls to use instead of the local stand-in server.'))
+    parser.add_argument('--jobs', '-n', type=int, default=50, help=(
+        'The total number of jobs.'))
+    parser.add_argument('--concurrency', '-c', type=int, default=4, help=(
+        'The number of concurrent jobs.'))
+    parser.add_argument('--no-download', dest='download',
+                        action='store_false', help=(
+                            'Only resolve the videos.'))
+    parser.add_argument('--videos', type=int, default=5, help=(
+        'The number of stand-in videos.'))
+    parser.add_argument('--size', type=int, default=1024 * 1024, help=(
+        'The size in bytes of every stand-in stream.'))
+    parser.add_argument('--latency', type=float, default=0, help=(
+        'The stand-in response delay in seconds.'))
+    parser.add_argument('--bandwidth', type=int, default=None, help=(
+        'The stand-in bandwidth cap per connection in bytes/sec.'))
+    parser.add_argument('--fault-rate', type=float, default=0, help=(
+        'The probability of a stand-in media request failing.'))
+    parser.add_argument('--disk-latency', type=float, default=0, help=(
+        'The delay in seconds added to every write to disk.'))
+    parser.add_argument('--write-behind', action='store_true', help=(
+        'Write to disk from a separate thread.'))
+    parser.add_argument('--video-info', action='store_true', help=(
+        'Resolve the videos from the video info endpoint.'))
+    parser.add_argument('--unciphered', action='store_true', help=(
+        'Serve stand-in streams that need no signature deciphering.'))
+    parser.add_argument('--retries', type=int, default=3, help=(
+        'The number of retries of failed requests.'))
+    parser.add_argument('--seed', type=int, default=None, help=(
+        'The seed of the fault injection.'))
+    parser.add_argument('--json', action='store_true', help=(
+        'Print the report as json.'))
+    args = parser.parse_args(argv)
+
+    retry_policy = RetryPolicy(retries=args.retries, backoff=0.05)
+    server = None
+    urls = args.urls
+    if not urls:
+        server = StandInServer(
+            [StandInVideo('standin-{:03d}'.format(i), size=args.size,
+                          ciphered=not args.unciphered)
+             for i in range(args.videos)],
+            latency=args.latency, bandwidth=args.bandwidth,
+            fault_rate=args.fault_rate, seed=args.seed).start()
+        urls = [server.watch_url(v) for v in sorted(server.videos)]
+    try:
+        report = run(urls, args.jobs, args.concurrency,
+                     download=args.download, retry_policy=retry_policy,
+                     disk_latency=args.disk_latency,
+                     video_info=args.video_info,
+                     write_behind=args.write_behind)
+    finally:
+        if server:
+            server.stop()
+    if args.json:
+        summary = report.summary()
+        if server:
+            summary['server'] = server.stats
+        print(json.dumps(summary))
+    else:
+        print(report.format())
+    return 1 if report.errors else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,20 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+import copy
+import hashlib
+import io
+import logging
 import os
-from time import clock
-
+import threading
+import time
 try:
-    from urllib2 import urlopen
+    from Queue import Queue
 except ImportError:
-    from urllib.request import urlopen
+    from queue import Queue
+
+from .exceptions import PytubeError, IncompleteDownload, ChecksumMismatch
+from .request import DEFAULT_RETRY_POLICY, HTTPError, open_url, \
+    replace_host, urlopen
+from .utils import monotonic
+
+log = logging.getLogger(__name__)
 
 
 class Video(object):
     """Class representation of a single instance of a YouTube video.
     """
     def __init__(self, url, filename, extension, resolution, video_codec,
-                 profile, video_bitrate, audio_codec, audio_bitrate):
+                 profile, video_bitrate, audio_codec, audio_bitrate,
+                 fallback_host=None, retry_policy=None, itag=None,
+                 quality=None, adaptive=False, filesize=None):
         """Sets-up the video object.
 
         :param str url:
@@ -35,6 +48,23 @@ class Video(object):
             The codec used to encode the audio.
         :param str audio_bitrate:
             The bitrate of the video's audio over sampling interval.
+        :param str fallback_host:
+            An alternative host serving the same stream, used when the
+            primary one fails.
+        :param RetryPolicy retry_policy:
+            The default retry policy for downloads.
+        :param int itag:
+            The YouTube format id of the video.
+        :param tuple quality:
+            The numeric ``(resolution, video_bitrate, audio_bitrate)`` of the
+            video, as returned by ``parse_quality()``. Parsed from the string
+            attributes when not given.
+        :param bool adaptive:
+            Whether this is an adaptive stream, holding only the audio or only
+            the video track.
+        :param int filesize:
+            The size of the video in bytes, if already known (e.g.: from the
+            ``clen`` field of the stream map).
         """
         self.url = url
         self.filename = filename
@@ -45,10 +75,128 @@ class Video(object):
         self.video_bitrate = video_bitrate
         self.audio_codec = audio_codec
         self.audio_bitrate = audio_bitrate
+        self.fallback_host = fallback_host
+        self.retry_policy = retry_policy
+        self.itag = itag
+        self.adaptive = adaptive
+        self.filesize = filesize
+        if quality is None:
+            quality = parse_quality(resolution, video_bitrate, audio_bitrate)
+        self.quality = quality
+        (self.resolution_value, self.video_bitrate_value,
+         self.audio_bitrate_value) = quality
+
+    @property
+    def is_audio_only(self):
+        """Whether the video only holds an audio track."""
+        return self.video_codec is None and self.audio_codec is not None
+
+    @property
+    def is_video_only(self):
+        """Whether the video only holds a video track."""
+        return self.audio_codec is None and self.video_codec is not None
+
+    def with_filename(self, filename):
+        """Gets a copy of the video saved to another filename. The copy of a
+        frozen video is frozen too.
+
+        :param str filename:
+            The filename (minus the extension) to save the video.
+        """
+        return self._replace(filename=filename)
+
+    def freeze(self):
+        """Gets a read-only copy of the video, e.g.: to share it between
+        threads as part of a ``ResolvedVideo``. Assigning its attributes
+        raises ``AttributeError``; derive variants with ``with_filename()``.
+        """
+        return self._replace(_frozen=True)
+
+    @property
+    def frozen(self):
+        """Whether the video is read-only (see ``freeze()``)."""
+        return self.__dict__.get('_frozen', False)
+
+    def __setattr__(self, name, value):
+        if self.frozen:
+            raise AttributeError("Video is read-only, use with_filename() "
+                                 "to derive a copy")
+        object.__setattr__(self, name, value)
+
+    def _replace(self, **changes):
+        """Gets a copy of the video with some attributes changed, bypassing
+        the read-only guard of frozen videos.
+        """
+        video = copy.copy(self)
+        video.__dict__.update(changes)
+        return video
+
+    def to_dict(self):
+        """Gets the state of the video (its signed url and profile) as a
+        dictionary of plain values, see ``from_dict()``.
+        """
+        return dict((key, getattr(self, key)) for key in _SNAPSHOT_FIELDS)
+
+    @classmethod
+    def from_dict(cls, data, retry_policy=None):
+        """Creates a video from the dictionary returned by ``to_dict()``.
+
+        :param dict data:
+            The state of the video.
+        :param RetryPolicy retry_policy:
+            The default retry policy for downloads.
+        """
+        kwargs = dict((key, data.get(key)) for key in _SNAPSHOT_FIELDS)
+        kwargs['adaptive'] = bool(kwargs['adaptive'])
+        return cls(retry_policy=retry_policy, **kwargs)
+
+    def probe_size(self, retry_policy=None):
+        """Gets the size of the video in bytes without downloading it, with a
+        HEAD request (or a single byte range request if the server doesn't
+        announce the size on HEAD). The result is cached as ``filesize``,
+        unless the video is frozen.
+
+        :param RetryPolicy retry_policy:
+            How to retry transient errors. Defaults to the video's
+            ``retry_policy``.
+        """
+        if self.filesize is not None:
+            return self.filesize
+        policy = retry_policy or self.retry_policy or DEFAULT_RETRY_POLICY
+        filesize = None
+        try:
+            response = urlopen(self.url, {'Accept-Encoding': 'identity'},
+                               retry_policy=policy, method='HEAD')
+            filesize = _get_file_size(response)
+            response.close()
+        except HTTPError as e:
+            # Some servers refuse HEAD requests, fall back to a range.
+            if e.code not in (403, 405, 501):
+                raise
+        if filesize is None:
+            response = urlopen(self.url, {'Range': 'bytes=0-0',
+                                          'Accept-Encoding': 'identity'},
+                               retry_policy=policy)
+            if _is_partial(response):
+                filesize = _get_file_size(response)
+            response.close()
+        if not self.frozen:
+            self.filesize = filesize
+        return filesize
+
+    def get_urls(self):
+        """Gets the urls serving this video, primary url first followed by
+        the url rewritten to each fallback host.
+        """
+        hosts = self.fallback_host or []
+        if not isinstance(hosts, (list, tuple)):
+            hosts = [hosts]
+        return [self.url] + [replace_host(self.url, h) for h in hosts]
 
     def download(self, path='', chunk_size=8 * 1024, on_progress=None,
-                 on_finish=None, force_overwrite=False):
-        """Downloads the video.
+                 on_finish=None, force_overwrite=False, checksums=None,
+                 retry_policy=None, write_behind=False, byte_range=None):
+        """Downloads the video, or only a byte range of it.
 
         :param str path:
             The destination output directory.
@@ -58,12 +206,167 @@ class Video(object):
         :param func on_progress:
             The function to be called every time the buffer is written
             to. Arguments passed are the bytes recieved, file size, and start
-            datetime.
+            time (from ``pytube.utils.monotonic``). A
+            ``pytube.progress.ProgressTask`` can be passed here directly.
         :param func on_finish:
             The function to be called when the download is complete. Arguments
-            passed are the full path to downloaded the file.
+            passed are the full path to downloaded the file, followed by the
+            dictionary of hex digests if ``checksums`` were requested.
+        :param bool force_overwrite:
+            Force a file overwrite if conflicting one exists.
+        :param checksums:
+            The ``hashlib`` algorithms (e.g.: sha256, md5) to compute while the
+            file is being downloaded. If a dictionary mapping algorithms to
+            expected hex digests is given, the digests are verified and
+            ``ChecksumMismatch`` is raised on a difference.
+        :param RetryPolicy retry_policy:
+            How to retry transient errors. A failed transfer is resumed from
+            the current byte offset, alternating between the primary url and
+            the fallback hosts. Defaults to the video's ``retry_policy``.
+        :param write_behind:
+            Write to disk from a separate thread, so a slow disk doesn't stall
+            the network reads. The file is preallocated from the
+            ``Content-Length`` and the chunks are coalesced into large
+            sequential writes. Either ``True`` or a dictionary of
+            ``WriteBehindFile`` arguments (e.g.: ``{'buffer_size': 4 << 20}``).
+        :param tuple byte_range:
+            The first and last (inclusive, ``None`` for the end of the video)
+            byte offsets to download, e.g.: ``(0, 1024 * 1024 - 1)`` for the
+            first MB. The file then only holds these bytes.
+        """
+        path = self._get_path(path, force_overwrite)
+        writer_options = None
+        if write_behind:
+            writer_options = write_behind if isinstance(
+                write_behind, dict) else {}
+        policy = retry_policy or self.retry_policy or DEFAULT_RETRY_POLICY
+        hashes = dict((name, hashlib.new(name)) for name in checksums or ())
+        # Opened outside of the try/except block, so a file that couldn't be
+        # created isn't removed (hiding the original error).
+        raw_file = self._open_file(path)
+        # TODO: Let's get rid of this whole try/except block, let ``OSErrors``
+        # fail loudly.
+        try:
+            with raw_file:
+                if writer_options is None:
+                    file_size, hashes, bytes_received = self._transfer(
+                        raw_file, chunk_size, on_progress, policy, hashes,
+                        byte_range=byte_range)
+                else:
+                    dst_file = WriteBehindFile(raw_file, **writer_options)
+                    try:
+                        file_size, hashes, bytes_received = self._transfer(
+                            dst_file, chunk_size, on_progress, policy, hashes,
+                            preallocate=raw_file, byte_range=byte_range)
+                    except BaseException:
+                        dst_file.close(discard=True)
+                        raise
+                    dst_file.close()
+
+        except KeyboardInterrupt:
+            # TODO: Move this into the cli, ``KeyboardInterrupt`` handling
+            # should be taken care of by the client. Also you should be allowed
+            # to disable this.
+            os.remove(path)
+            raise KeyboardInterrupt("Interrupt signal given. Deleting "
+                                    "incomplete video.")
+        except Exception:
+            os.remove(path)
+            raise
+
+        result = DownloadResult(
+            path, bytes_received, file_size,
+            dict((name, h.hexdigest()) for name, h in hashes.items()))
+        try:
+            result.verify(checksums if isinstance(checksums, dict) else None)
+        except PytubeError:
+            os.remove(path)
+            raise
+        if on_finish:
+            if hashes:
+                on_finish(path, result.checksums)
+            else:
+                on_finish(path)
+        return result
+
+    def download_ranges(self, ranges, path=None, chunk_size=8 * 1024,
+                        on_progress=None, on_finish=None,
+                        force_overwrite=False, retry_policy=None):
+        """Downloads several byte ranges of the video (e.g.: the container
+        header and a sample from the middle), either into a set of buffers or
+        into a single sparse file where each range is written at its own
+        offset.
+
+        Returns the list of buffers (as bytes) when no ``path`` is given,
+        otherwise a ``DownloadResult`` of the sparse file.
+
+        :param list ranges:
+            The ``(first, last)`` byte offsets of each range (``last`` being
+            inclusive, or ``None`` for the end of the video).
+        :param str path:
+            The destination output directory or file. If not given, the
+            ranges are returned as buffers.
+        :param int chunk_size:
+            File size (in bytes) to read at a time.
+        :param func on_progress:
+            The function to be called every time the buffer is written to.
+            Arguments passed are the bytes received and the total size of all
+            ranges (``None`` if unknown), and the start time.
+        :param func on_finish:
+            The function to be called when all ranges are downloaded.
+            Arguments passed are the path to the file (``None`` for buffers).
         :param bool force_overwrite:
             Force a file overwrite if conflicting one exists.
+        :param RetryPolicy retry_policy:
+            How to retry transient errors. Defaults to the video's
+            ``retry_policy``.
+        """
+        policy = retry_policy or self.retry_policy or DEFAULT_RETRY_POLICY
+        total_size = None
+        if all(last is not None for _, last in ranges):
+            total_size = sum(last - first + 1 for first, last in ranges)
+        received = [0]
+        start = monotonic()
+
+        def progress(bytes_received, file_size, _):
+            if on_progress:
+                on_progress(received[0] + bytes_received, total_size, start)
+
+        def transfer(dst_file, byte_range):
+            received[0] += self._transfer(dst_file, chunk_size, progress,
+                                          policy, {}, byte_range=byte_range)[2]
+
+        if path is None:
+            buffers = []
+            for byte_range in ranges:
+                dst_file = io.BytesIO()
+                transfer(dst_file, byte_range)
+                buffers.append(dst_file.getvalue())
+            if on_finish:
+                on_finish(None)
+            return buffers
+
+        path = self._get_path(path, force_overwrite)
+        dst_file = self._open_file(path)
+        try:
+            with dst_file:
+                for byte_range in ranges:
+                    dst_file.seek(byte_range[0])
+                    transfer(dst_file, byte_range)
+        except BaseException:
+            os.remove(path)
+            raise
+        if on_finish:
+            on_finish(path)
+        return DownloadResult(path, received[0], total_size)
+
+    def _get_path(self, path, force_overwrite=False):
+        """Gets the full path of the file to download to.
+
+        :param str path:
+            The destination output directory or file.
+        :param bool force_overwrite:
+            Allow an existing file to be overwritten.
         """
         path = os.path.normpath(path)
         if os.path.isdir(path):
@@ -74,43 +377,132 @@ class Video(object):
         # handled by the library.
         if os.path.isfile(path) and not force_overwrite:
             raise OSError("Conflicting filename:'{}'".format(self.filename))
-        # TODO: Split up the downloading and OS jazz into separate functions.
-        response = urlopen(self.url)
-        meta_data = dict(response.info().items())
-        file_size = int(meta_data.get("Content-Length") or
-                        meta_data.get("content-length"))
-        self._bytes_received = 0
-        start = clock()
-        # TODO: Let's get rid of this whole try/except block, let ``OSErrors``
-        # fail loudly.
-        try:
-            with open(path, 'wb') as dst_file:
+        return path
+
+    def _transfer(self, dst_file, chunk_size, on_progress, retry_policy,
+                  hashes, preallocate=None, byte_range=None):
+        """Streams the video (or a byte range of it) into ``dst_file``. On a
+        transient error the transfer is resumed from the current offset,
+        alternating between the primary url and the fallback hosts. Returns
+        the number of bytes expected (``None`` if unknown), the updated hashes
+        and the number of bytes received. The state of the transfer is kept
+        in locals, so the same video can be downloaded by several threads at
+        once.
+
+        :param dst_file:
+            The file to write to.
+        :param int chunk_size:
+            File size (in bytes) to read at a time.
+        :param func on_progress:
+            The progress hook of ``download()``.
+        :param RetryPolicy retry_policy:
+            How to retry transient errors.
+        :param dict hashes:
+            The ``hashlib`` objects to update, keyed by algorithm.
+        :param preallocate:
+            A file to preallocate once the file size is known.
+        :param tuple byte_range:
+            The first and last (inclusive, ``None`` for the end of the video)
+            byte offsets to transfer.
+        """
+        delays = retry_policy.delays()
+        urls = self.get_urls()
+        first, last = byte_range or (0, None)
+        file_size = None
+        bytes_received = 0
+        attempt = 0
+        start = monotonic()
+        while True:
+            try:
+                # A byte range is always requested explicitly, even from the
+                # start of the video, so the server answers 206.
+                offset = first + bytes_received
+                if byte_range is None and not offset:
+                    offset = None
+                response = self._open(urls[attempt % len(urls)], offset,
+                                      last, retry_policy.timeout)
+                partial = _is_partial(response)
+                if byte_range and not partial:
+                    raise PytubeError("The server doesn't support byte "
+                                      "ranges.")
+                if bytes_received and not partial:
+                    # The server ignored the range, so start over.
+                    log.debug("range not honored, restarting")
+                    dst_file.seek(0)
+                    dst_file.truncate()
+                    bytes_received = 0
+                    hashes = dict((name, hashlib.new(name)) for name in hashes)
+                if file_size is None:
+                    # Nothing was received yet, so a partial response holds
+                    # the whole range.
+                    file_size = _get_file_size(response,
+                                               partial=bool(byte_range))
+                    if preallocate is not None and file_size:
+                        _preallocate(preallocate, file_size)
                 while True:
-                    self._buffer = response.read(chunk_size)
+                    buffer = response.read(chunk_size)
                     # Check if the buffer is empty (aka no bytes remaining).
-                    if not self._buffer:
-                        if on_finish:
-                            # TODO: We possibly want to flush the
-                            # `_bytes_recieved`` buffer before we call
-                            # ``on_finish()``.
-                            on_finish(path)
+                    if not buffer:
                         break
 
-                    self._bytes_received += len(self._buffer)
-                    dst_file.write(self._buffer)
+                    bytes_received += len(buffer)
+                    dst_file.write(buffer)
+                    for h in hashes.values():
+                        h.update(buffer)
                     if on_progress:
-                        on_progress(self._bytes_received, file_size, start)
+                        on_progress(bytes_received, file_size, start)
+                if file_size is not None and bytes_received < file_size:
+                    raise IncompleteDownload(
+                        "Connection closed after {} of {} bytes".format(
+                            bytes_received, file_size))
+                return file_size, hashes, bytes_received
+            except Exception as e:
+                delay = None
+                if isinstance(e, IncompleteDownload) or \
+                        retry_policy.is_retryable(e):
+                    delay = next(delays, None)
+                if delay is None:
+                    raise
+                attempt += 1
+                log.warning("download failed at byte %d (%s), retrying in "
+                            "%.2fs", bytes_received, e, delay)
+                time.sleep(delay)
 
-        except KeyboardInterrupt:
-            # TODO: Move this into the cli, ``KeyboardInterrupt`` handling
-            # should be taken care of by the client. Also you should be allowed
-            # to disable this.
-            os.remove(path)
-            raise KeyboardInterrupt("Interrupt signal given. Deleting "
-                                    "incomplete video.")
+    def _open_file(self, path):
+        """Opens the destination file for writing.
+
+        :param str path:
+            The full path to the file.
+        """
+        return open(path, 'wb')
+
+    def _open(self, url, offset=None, end=None, timeout=None):
+        """Opens the video url, requesting the bytes from ``offset`` onwards.
+
+        :param str url:
+            The url of the video.
+        :param int offset:
+            The offset of the first byte to request, ``None`` to request the
+            whole video without a ``Range`` header.
+        :param int end:
+            The offset of the last byte to request (inclusive), ``None`` for
+            the end of the video.
+        :param float timeout:
+            The socket timeout in seconds.
+        """
+        # Media doesn't compress, and sizes and ranges must be in bytes of
+        # the file itself.
+        headers = {'Accept-Encoding': 'identity'}
+        if offset is not None:
+            headers['Range'] = 'bytes={}-{}'.format(
+                offset, '' if end is None else end)
+        return open_url(url, headers, timeout)
 
     def __repr__(self):
         """A clean representation of the class instance."""
+        if self.is_audio_only:
+            return "<Video: {} (.{}) - {}kbps - audio only>".format(
+                self.audio_codec, self.extension, self.audio_bitrate)
         return "<Video: {} (.{}) - {} - {}>".format(
             self.video_codec, self.extension, self.resolution, self.profile)
 
@@ -122,6 +514,241 @@ class Video(object):
             The instance of the other video instance for comparison.
         """
         if isinstance(other, Video):
-            v1 = "{0} {1}".format(self.extension, self.resolution)
-            v2 = "{0} {1}".format(other.extension, other.resolution)
-            return (v1 > v2) - (v1 < v2) < 0
+            # Compare the numeric resolution, so "720p" sorts before "1080p".
+            v1 = (self.extension, self.resolution_value or 0)
+            v2 = (other.extension, other.resolution_value or 0)
+            return v1 < v2
+
+
+# The attributes saved by ``Video.to_dict()``, the numeric quality is parsed
+# again from the strings.
+_SNAPSHOT_FIELDS = ('url', 'filename', 'extension', 'resolution',
+                    'video_codec', 'profile', 'video_bitrate', 'audio_codec',
+                    'audio_bitrate', 'fallback_host', 'itag', 'adaptive',
+                    'filesize')
+
+
+def parse_quality(resolution, video_bitrate, audio_bitrate):
+    """Parses the quality profile strings into a numeric ``(resolution,
+    video_bitrate, audio_bitrate)`` tuple. Bitrate ranges (e.g.: "2-2.9") are
+    parsed to their upper bound and unknown values (e.g.: "N/A") to ``None``.
+
+    :param str resolution:
+        The broadcasting standard (e.g.: 720p).
+    :param str video_bitrate:
+        The video bitrate in Mbit/s (e.g.: 0.5, 2-2.9).
+    :param str audio_bitrate:
+        The audio bitrate in kbit/s (e.g.: 192).
+    """
+    def number(value):
+        try:
+            return float(str(value).rstrip("p").split("-")[-1])
+        except ValueError:
+            return None
+    resolution = number(resolution)
+    if resolution is not None:
+        resolution = int(resolution)
+    return resolution, number(video_bitrate), number(audio_bitrate)
+
+
+class WriteBehindFile(object):
+    """Wraps a file so that writes are copied into a small pool of reusable
+    buffers and written by a background thread. Small writes are coalesced
+    until a buffer is full, so the disk sees large sequential writes, and the
+    writer only blocks once every buffer is waiting on the disk.
+    """
+    def __init__(self, fileobj, buffer_size=1024 * 1024, buffers=4):
+        """Sets-up the writer and starts its thread.
+
+        :param fileobj:
+            The file to write to.
+        :param int buffer_size:
+            The size in bytes of each buffer, i.e. of each write to the file.
+        :param int buffers:
+            The number of buffers, bounding the memory used and how far the
+            writes can get ahead of the disk.
+        """
+        self._file = fileobj
+        self._buffer_size = buffer_size
+        self._free = Queue()
+        self._full = Queue()
+        for _ in range(buffers):
+            self._free.put(bytearray(buffer_size))
+        self._current = self._free.get()
+        self._fill = 0
+        self._error = None
+        self._discard = False
+        self._thread = threading.Thread(target=self._run,
+                                        name='pytube-writer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def write(self, data):
+        """Queues data to be written.
+
+        :param bytes data:
+            The data to write.
+        """
+        view = memoryview(data)
+        while len(view):
+            count = min(len(view), self._buffer_size - self._fill)
+            self._current[self._fill:self._fill + count] = view[:count]
+            self._fill += count
+            view = view[count:]
+            if self._fill == self._buffer_size:
+                self._submit()
+
+    def flush(self):
+        """Waits until all queued data is written to the file."""
+        self._submit()
+        self._full.join()
+        self._raise()
+        self._file.flush()
+
+    def seek(self, offset):
+        """Flushes the queued data and moves the file position."""
+        self.flush()
+        return self._file.seek(offset)
+
+    def truncate(self, size=None):
+        """Flushes the queued data and truncates the file."""
+        self.flush()
+        return self._file.truncate(size)
+
+    def close(self, discard=False):
+        """Writes the queued data and stops the thread. The wrapped file is
+        left open.
+
+        :param bool discard:
+            Drop the data not yet written and ignore write errors (e.g.: when
+            the download failed).
+        """
+        if discard:
+            # Buffers still queued are handed back without being written.
+            self._discard = True
+        else:
+            self._submit()
+        self._full.put(None)
+        self._thread.join()
+        if not discard:
+            self._raise()
+            self._file.flush()
+
+    def _submit(self):
+        """Hands the current buffer to the writer thread and takes a free
+        one, blocking while all buffers are in use.
+        """
+        self._raise()
+        if not self._fill:
+            return
+        self._full.put((self._current, self._fill))
+        self._current = self._free.get()
+        self._fill = 0
+
+    def _raise(self):
+        """Raises the error the writer thread failed with, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        """The body of the writer thread."""
+        while True:
+            item = self._full.get()
+            if item is None:
+                self._full.task_done()
+                return
+            buf, count = item
+            try:
+                if self._error is None and not self._discard:
+                    self._file.write(memoryview(buf)[:count])
+            except Exception as e:
+                self._error = e
+            finally:
+                self._free.put(buf)
+                self._full.task_done()
+
+
+def _preallocate(fileobj, size):
+    """Reserves the disk space of a file, where the platform supports it.
+
+    :param fileobj:
+        The file to preallocate.
+    :param int size:
+        The size in bytes to reserve.
+    """
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(fileobj.fileno(), 0, size)
+    except (OSError, AttributeError, ValueError) as e:
+        log.debug("unable to preallocate %d bytes: %s", size, e)
+
+
+def _is_partial(response):
+    """Whether the response is a "206 Partial Content" response."""
+    return response.getcode() == 206
+
+
+def _get_file_size(response, partial=False):
+    """Gets the total size of the resource from the response headers, or
+    ``None`` when the server doesn't announce it.
+
+    :param response:
+        The response returned by ``urlopen``.
+    :param bool partial:
+        Get the size of the returned range rather than of the resource.
+    """
+    meta_data = dict(response.info().items())
+    content_range = (meta_data.get("Content-Range") or
+                     meta_data.get("content-range"))
+    if content_range and not content_range.endswith("/*") and not partial:
+        return int(content_range.rsplit("/", 1)[1])
+    file_size = (meta_data.get("Content-Length") or
+                 meta_data.get("content-length"))
+    return int(file_size) if file_size is not None else None
+
+
+class DownloadResult(object):
+    """The outcome of a completed ``Video.download``.
+    """
+    def __init__(self, path, bytes_received, file_size, checksums=None):
+        """Sets-up the download result.
+
+        :param str path:
+            The full path to the downloaded file.
+        :param int bytes_received:
+            The number of bytes written to the file.
+        :param int file_size:
+            The size announced by the server (``None`` if unknown).
+        :param dict checksums:
+            The hex digests computed during the transfer, keyed by algorithm.
+        """
+        self.path = path
+        self.bytes_received = bytes_received
+        self.file_size = file_size
+        self.checksums = checksums or {}
+
+    def verify(self, expected=None):
+        """Checks the number of bytes received against the file size and,
+        optionally, the computed checksums against the expected ones.
+
+        :param dict expected:
+            The expected hex digests keyed by algorithm. ``None`` values are
+            skipped.
+        """
+        if (self.file_size is not None and
+                self.bytes_received != self.file_size):
+            raise IncompleteDownload(
+                "Received {} of {} bytes for '{}'".format(
+                    self.bytes_received, self.file_size, self.path))
+        for name, digest in (expected or {}).items():
+            if digest and self.checksums.get(name) != digest.lower():
+                raise ChecksumMismatch(
+                    "The {} checksum of '{}' is {}, expected {}".format(
+                        name, self.path, self.checksums.get(name), digest))
+        return True
+
+    def __repr__(self):
+        """A clean representation of the class instance."""
+        return "<DownloadResult: {} ({} bytes)>".format(
+            self.path, self.bytes_received)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import json
+import logging
+import threading
+try:
+    from Queue import Queue, Empty, Full
+    from urlparse import urlparse, parse_qs
+    from urllib import urlencode
+except ImportError:
+    from queue import Queue, Empty, Full
+    from urllib.parse import urlparse, parse_qs, urlencode
+
+from .api import YouTube
+from .exceptions import PytubeError
+from .request import get
+from .utils import extract_json
+
+log = logging.getLogger(__name__)
+
+# Marks the end of a queue in the resolution pipeline.
+_DONE = object()
+
+
+class Playlist(object):
+    """Class representation of a YouTube playlist. Video ids are fetched one
+    page at a time and yielded as soon as each page is parsed, so memory use
+    doesn't depend on the size of the playlist.
+    """
+    def __init__(self, url, retry_policy=None):
+        """Initializes the playlist.
+
+        :param str url:
+            The url to the YouTube playlist (or any url with a ``list``
+            parameter, e.g.: a watch url).
+        :param RetryPolicy retry_policy:
+            How to retry transient network errors.
+        """
+        parts = urlparse(url)
+        playlist_id = parse_qs(parts.query).get('list')
+        if not playlist_id:
+            raise PytubeError("No playlist id found in url: {}".format(url))
+        self.playlist_id = playlist_id.pop()
+        self.retry_policy = retry_policy
+        self._base_url = "{}://{}".format(parts.scheme, parts.netloc)
+
+    @property
+    def url(self):
+        """Gets the playlist url."""
+        return "{}/playlist?{}".format(
+            self._base_url, urlencode({'list': self.playlist_id}))
+
+    def video_ids(self):
+        """Generates the video ids of the playlist, fetching the next page
+        only once the ids of the current one are consumed.
+        """
+        html = get(self.url, retry_policy=self.retry_policy)
+        data = extract_json(html, 'window["ytInitialData"] = ')
+        while data is not None:
+            video_ids, continuation = self._parse_page(data)
+            # Drop the parsed page before fetching the next one.
+            data = None
+            for video_id in video_ids:
+                yield video_id
+            if continuation:
+                log.debug("fetching playlist continuation %s", continuation)
+                data = json.loads(get(self._continuation_url(continuation),
+                                      retry_policy=self.retry_policy))
+
+    def video_urls(self):
+        """Generates the watch url of every video in the playlist."""
+        for video_id in self.video_ids():
+            yield "{}/watch?{}".format(
+                self._base_url, urlencode({'v': video_id}))
+
+    def resolve(self, workers=4, ignore_errors=False):
+        """Generates a resolved ``YouTube`` instance for every video of the
+        playlist. Resolution starts as soon as an id is discovered, using a
+        pool of worker threads, and instances are yielded as they complete.
+
+        :param int workers:
+            The number of videos resolved concurrently.
+        :param bool ignore_errors:
+            Log and skip videos that fail to resolve instead of raising.
+        """
+        return self._pipeline(self._resolve, workers, ignore_errors)
+
+    def download(self, path='', workers=4, select=None, ignore_errors=False,
+                 **kwargs):
+        """Resolves and downloads every video of the playlist, pipelining
+        each video id into a download as soon as it is discovered. Generates
+        a ``DownloadResult`` for every completed download.
+
+        :param str path:
+            The destination output directory.
+        :param int workers:
+            The number of videos resolved and downloaded concurrently.
+        :param func select:
+            Picks the ``Video`` to download given a ``YouTube`` instance.
+            Defaults to the highest quality one (``YouTube.select()``).
+        :param bool ignore_errors:
+            Log and skip videos that fail instead of raising.
+        :param kwargs:
+            Additional arguments passed to ``Video.download``.
+        """
+        select = select or (lambda yt: yt.select())
+
+        def download(video_id):
+            video = select(self._resolve(video_id))
+            return video.download(path, **kwargs)
+        return self._pipeline(download, workers, ignore_errors)
+
+    def _resolve(self, video_id):
+        """Resolves a single video of the playlist.
+
+        :param str video_id:
+            The id of the video.
+        """
+        url = "{}/watch?{}".format(self._base_url, urlencode({'v': video_id}))
+        return YouTube(url, retry_policy=self.retry_policy)
+
+    def _continuation_url(self, continuation):
+        """Gets the url of the next page of the playlist.
+
+        :param str continuation:
+            The continuation token of the previous page.
+        """
+        return "{}/browse_ajax?{}".format(self._base_url, urlencode({
+            'ctoken': continuation, 'continuation': continuation}))
+
+    def _parse_page(self, data):
+        """Extracts the video ids and the continuation token (``None`` on the
+        last page) from a page of the playlist.
+
+        :param data:
+            The decoded json of the page.
+        """
+        video_ids = []
+        seen = set()
+        continuation = None
+        stack = [data]
+        # Walk the json rather than following a fixed path, the nesting of
+        # the renderers differs between the first page and the continuations.
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+            video = node.get('playlistVideoRenderer')
+            if video is not None:
+                # Deleted and private entries are listed without an id.
+                video_id = video.get('videoId')
+                if video_id and video_id not in seen:
+                    seen.add(video_id)
+                    video_ids.append(video_id)
+                continue
+            token = node.get('nextContinuationData', {}).get('continuation')
+            if token:
+                continuation = token
+            stack.extend(reversed(list(node.values())))
+        return video_ids, continuation
+
+    def _pipeline(self, func, workers, ignore_errors):
+        """Applies ``func`` to every video id on a pool of worker threads as
+        the ids are discovered, and generates the results. The queues between
+        the stages are bounded, so the pipeline never holds more than a few
+        items per worker.
+
+        :param func func:
+            The function to apply to each video id.
+        :param int workers:
+            The number of worker threads.
+        :param bool ignore_errors:
+            Log and skip failed ids instead of raising.
+        """
+        ids = Queue(maxsize=workers)
+        results = Queue(maxsize=workers)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for video_id in self.video_ids():
+                    if not _put(ids, video_id, stop):
+                        return
+            except Exception as e:
+                _put(results, e, stop)
+            for _ in range(workers):
+                _put(ids, _DONE, stop)
+
+        def work():
+            while True:
+                video_id = _get(ids, stop)
+                if video_id is _DONE or stop.is_set():
+                    _put(results, _DONE, stop)
+                    return
+                try:
+                    result = func(video_id)
+                except Exception as e:
+                    if not ignore_errors:
+                        result = e
+                    else:
+                        log.exception("skipping video %s", video_id)
+                        continue
+                if not _put(results, result, stop):
+                    return
+
+        threads = [threading.Thread(target=produce)]
+        threads.extend(threading.Thread(target=work) for _ in range(workers))
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            finished = 0
+            while finished < workers:
+                result = results.get()
+                if result is _DONE:
+                    finished += 1
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    yield result
+        finally:
+            stop.set()
+
+
+def _put(queue, item, stop, timeout=0.1):
+    """Puts an item on a bounded queue, giving up once ``stop`` is set.
+    Returns whether the item was queued.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=timeout)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _get(queue, stop, timeout=0.1):
+    """Gets an item from a queue, returning ``_DONE`` once ``stop`` is set.
+    """
+    while not stop.is_set():
+        try:
+            return queue.get(timeout=timeout)
+        except Empty:
+            continue
+    return _DONE
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import json
+import threading
+from sys import stdout
+
+from .utils import monotonic, sizeof
+
+
+class ProgressTask(object):
+    """Progress state for a single download tracked by a
+    :class:`ProgressReporter`.
+
+    Instances are callable with the same arguments as the ``on_progress``
+    hook of ``Video.download`` and expose :meth:`finish` for ``on_finish``,
+    so a task can be handed to a download directly.
+    """
+    __slots__ = ('name', 'bytes_received', 'file_size', 'started',
+                 'finished')
+
+    def __init__(self, name, file_size=None):
+        """Sets-up the task.
+
+        :param str name:
+            A label for the download (e.g.: the filename).
+        :param int file_size:
+            The expected size in bytes, if already known.
+        """
+        self.name = name
+        self.bytes_received = 0
+        self.file_size = file_size
+        self.started = monotonic()
+        self.finished = False
+
+    def __call__(self, bytes_received, file_size, start=None):
+        """Records the download progress. This is called on every chunk, so it
+        does nothing beyond storing the counters.
+
+        :param int bytes_received:
+            The total number of bytes received so far.
+        :param int file_size:
+            The total size of the download.
+        :param float start:
+            Unused, accepted for compatibility with ``on_progress``.
+        """
+        self.bytes_received = bytes_received
+        self.file_size = file_size
+
+    def finish(self, *args):
+        """Marks the task as complete. Any arguments (e.g.: the path passed to
+        ``on_finish``) are ignored.
+        """
+        self.finished = True
+
+
+class ProgressReporter(object):
+    """Aggregates the progress of many concurrent downloads and renders it at
+    a fixed refresh rate from a background thread.
+
+    Download threads only update counters on their :class:`ProgressTask`; all
+    formatting and output happens in the reporter thread, at most once per
+    ``interval`` seconds.
+    """
+    def __init__(self, stream=None, interval=0.5, fmt='bar', smoothing=0.3,
+                 width=50, discard_finished=False):
+        """Sets-up the reporter.
+
+        :param stream:
+            A file-like object to write progress to. Defaults to stdout.
+        :param float interval:
+            The number of seconds between refreshes.
+        :param str fmt:
+            The output format, either ``bar`` for a human readable progress
+            bar or ``json`` for one JSON object per line.
+        :param float smoothing:
+            The weight (0-1) given to the latest sample in the exponentially
+            weighted transfer rate.
+        :param int width:
+            The width of the progress bar in characters.
+        :param bool discard_finished:
+            Whether to stop tracking the finished tasks once a render has
+            reported them, so a long-lived reporter only aggregates (and
+            keeps) the downloads in progress.
+        """
+        if fmt not in ('bar', 'json'):
+            raise ValueError("Unknown progress format: {}".format(fmt))
+        self.stream = stream or stdout
+        self.interval = interval
+        self.fmt = fmt
+        self.smoothing = smoothing
+        self.width = width
+        self.discard_finished = discard_finished
+        self.rate = 0.0
+        self._tasks = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_bytes = 0
+        self._last_time = None
+        self._started = None
+
+    def track(self, name, file_size=None):
+        """Creates and registers a new :class:`ProgressTask`.
+
+        :param str name:
+            A label for the download.
+        :param int file_size:
+            The expected size in bytes, if already known.
+        """
+        task = ProgressTask(name, file_size)
+        with self._lock:
+            self._tasks.append(task)
+        return task
+
+    def untrack(self, *tasks):
+        """Stops tracking the given tasks, removing them from the totals.
+
+        :param tasks:
+            The :class:`ProgressTask` instances to remove.
+        """
+        removed = set(id(t) for t in tasks)
+        with self._lock:
+            for task in self._tasks:
+                if id(task) in removed:
+                    # Keep the transfer rate from seeing the drop in bytes.
+                    self._last_bytes -= task.bytes_received
+            self._tasks = [t for t in self._tasks if id(t) not in removed]
+
+    def start(self):
+        """Starts the background rendering thread."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._started = self._last_time = monotonic()
+        self._thread = threading.Thread(target=self._run,
+                                        name='pytube-progress')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the rendering thread and renders the final state."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.render(final=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def totals(self):
+        """Gets the aggregated ``(bytes_received, file_size)`` of all tasks.
+        The file size is ``None`` until every task knows its size.
+        """
+        with self._lock:
+            tasks = list(self._tasks)
+        received = sum(t.bytes_received for t in tasks)
+        sizes = [t.file_size for t in tasks]
+        if not sizes or None in sizes:
+            return received, None
+        return received, sum(sizes)
+
+    def sample(self):
+        """Takes a snapshot of all tasks and updates the smoothed transfer
+        rate. Returns a dictionary describing the current state.
+        """
+        now = monotonic()
+        if self._last_time is None:
+            self._started = self._last_time = now
+        received, file_size = self.totals()
+        elapsed = now - self._last_time
+        if elapsed > 0:
+            current = (received - self._last_bytes) / elapsed
+            self.rate += self.smoothing * (current - self.rate)
+            self._last_bytes = received
+            self._last_time = now
+        with self._lock:
+            tasks = list(self._tasks)
+        return {
+            'elapsed': now - self._started,
+            'bytes_received': received,
+            'file_size': file_size,
+            'rate': self.rate,
+            'tasks': [{
+                'name': t.name,
+                'bytes_received': t.bytes_received,
+                'file_size': t.file_size,
+                'finished': t.finished,
+            } for t in tasks],
+        }
+
+    def render(self, final=False):
+        """Writes the current state to the output stream.
+
+        :param bool final:
+            Whether this is the last update.
+        """
+        with self._lock:
+            finished = [t for t in self._tasks if t.finished]
+        state = self.sample()
+        if self.fmt == 'json':
+            state['final'] = final
+            self.stream.write(json.dumps(state) + '\n')
+        else:
+            received, file_size = state['bytes_received'], state['file_size']
+            if file_size:
+                done = int(self.width * received / file_size)
+                percent = received * 100. / file_size
+            else:
+                done, percent = 0, 0.
+            self.stream.write("\r  [%s%s][%3.2f%%] %s at %s/s%s" % (
+                '=' * done, ' ' * (self.width - done), percent,
+                sizeof(file_size or received), sizeof(self.rate),
+                '\n' if final else '\r'))
+        self.stream.flush()
+        if self.discard_finished and finished:
+            self.untrack(*finished)
+
+    def _run(self):
+        """The body of the rendering thread."""
+        while not self._stop.wait(self.interval):
+            self.render()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import codecs
+import logging
+import random
+import socket
+import threading
+import time
+import zlib
+try:
+    from urllib2 import urlopen as _urlopen, Request, URLError, HTTPError
+    from urlparse import urlparse, urlunparse
+    from httplib import HTTPException
+except ImportError:
+    from urllib.error import URLError, HTTPError
+    from urllib.parse import urlparse, urlunparse
+    from urllib.request import urlopen as _urlopen, Request
+    from http.client import HTTPException
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .exceptions import PytubeError
+
+log = logging.getLogger(__name__)
+
+# The compressions accepted for pages and scripts; brotli only if the
+# ``brotli`` package is installed. Media is always requested uncompressed.
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli else 'gzip, deflate'
+
+try:  # Python 3.3+
+    _CONNECTION_ERRORS = (ConnectionError, socket.timeout)
+except NameError:
+    _CONNECTION_ERRORS = (socket.error,)
+
+# HTTP status codes worth retrying; anything else (e.g.: 403 or 404) is
+# permanent.
+RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+
+class RetryPolicy(object):
+    """Describes how often, and how long to wait before, a failed request is
+    retried. Delays grow exponentially and are jittered so that many workers
+    failing at once don't retry in lockstep.
+    """
+    def __init__(self, retries=3, backoff=0.5, max_backoff=30, jitter=True,
+                 timeout=30):
+        """Sets-up the retry policy.
+
+        :param int retries:
+            The number of retries after the first attempt.
+        :param float backoff:
+            The base delay in seconds, doubled after every attempt.
+        :param float max_backoff:
+            The upper bound of a single delay in seconds.
+        :param bool jitter:
+            Whether to pick a random delay between zero and the computed one
+            ("full jitter") instead of sleeping for the computed delay.
+        :param float timeout:
+            The socket timeout in seconds of every attempt, so a stalled
+            connection fails (and is retried) instead of blocking forever.
+            ``None`` to wait indefinitely.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.timeout = timeout
+
+    def delays(self):
+        """Generates the delay before each retry; exhausted once no retries
+        are left.
+        """
+        for attempt in range(self.retries):
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+            yield random.uniform(0, delay) if self.jitter else delay
+
+    def is_retryable(self, error):
+        """Whether the given exception is a transient network error.
+
+        :param Exception error:
+            The exception raised by the failed attempt.
+        """
+        if isinstance(error, HTTPError):
+            return error.code in RETRY_STATUS_CODES
+        return isinstance(error,
+                          (URLError, HTTPException) + _CONNECTION_ERRORS)
+
+    def call(self, func, *args, **kwargs):
+        """Calls ``func`` until it succeeds, retrying transient errors.
+
+        :param func func:
+            The function to call.
+        """
+        delays = self.delays()
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = next(delays, None) if self.is_retryable(e) else None
+                if delay is None:
+                    raise
+                log.warning("retrying in %.2fs after error: %s", delay, e)
+                time.sleep(delay)
+
+
+# The policy used when none is given.
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class SingleFlight(object):
+    """Coalesces concurrent identical calls: while a call for a key is in
+    flight, other callers for the same key wait for it and share its result
+    (or exception) instead of making their own. Nothing is cached once the
+    call completes.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def call(self, key, func, *args, **kwargs):
+        """Calls ``func``, unless a call for ``key`` is already in flight, in
+        which case its outcome is waited for.
+
+        :param key:
+            The identity of the call (e.g.: the url fetched).
+        :param func func:
+            The function to call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            log.debug("waiting for in-flight call: %s", key)
+            call.done.wait()
+            if isinstance(call.error, Exception):
+                raise call.error
+            elif call.error is not None:
+                # E.g.: the leader was interrupted, which doesn't concern the
+                # threads waiting for it.
+                raise PytubeError("In-flight call {} was aborted: {!r}".format(
+                    key, call.error))
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _Call(object):
+    """The outcome of a call shared by a ``SingleFlight``."""
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def urlopen(url, headers=None, retry_policy=None, timeout=None,
+            method=None):
+    """Opens a url, retrying transient errors according to ``retry_policy``.
+
+    :param str url:
+        The url to open.
+    :param dict headers:
+        Additional request headers.
+    :param RetryPolicy retry_policy:
+        The retry policy, ``DEFAULT_RETRY_POLICY`` if not given.
+    :param float timeout:
+        The socket timeout in seconds, the policy's ``timeout`` by default.
+    :param str method:
+        The HTTP method (e.g.: HEAD), GET by default.
+    """
+    policy = retry_policy or DEFAULT_RETRY_POLICY
+    if timeout is None:
+        timeout = policy.timeout
+    return policy.call(open_url, url, headers, timeout, method)
+
+
+def get(url, headers=None, retry_policy=None):
+    """Fetches a page and returns its decoded text.
+
+    :param str url:
+        The url of the page.
+    :param dict headers:
+        Additional request headers.
+    :param RetryPolicy retry_policy:
+        The retry policy, ``DEFAULT_RETRY_POLICY`` if not given.
+    """
+    return ''.join(iter_text(url, headers, retry_policy))
+
+
+def iter_text(url, headers=None, retry_policy=None, chunk_size=16 * 1024):
+    """Fetches a page, asking for a compressed transfer, and generates its
+    text as it arrives, decompressed and decoded incrementally. The response
+    is closed as soon as the generator is, so a caller can stop reading
+    halfway through the page.
+
+    :param str url:
+        The url of the page.
+    :param dict headers:
+        Additional request headers.
+    :param RetryPolicy retry_policy:
+        The retry policy, ``DEFAULT_RETRY_POLICY`` if not given.
+    :param int chunk_size:
+        The number of bytes read at a time.
+    """
+    headers = dict(headers or {})
+    headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
+    response = urlopen(url, headers, retry_policy)
+    if not response:
+        raise PytubeError("Unable to open url: {}".format(url))
+    try:
+        decompress = _get_decompressor(
+            response.info().get('Content-Encoding'))
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while True:
+            chunk = response.read(chunk_size)
+            if not chunk:
+                break
+            if decompress:
+                try:
+                    chunk = decompress(chunk)
+                except zlib.error as e:
+                    raise PytubeError(
+                        "Unable to decompress {}: {}".format(url, e))
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b'', True)
+        if text:
+            yield text
+    finally:
+        response.close()
+
+
+def _get_decompressor(encoding):
+    """Gets a function decompressing the successive chunks of a body sent with
+    the given ``Content-Encoding``, ``None`` if it isn't compressed.
+
+    :param str encoding:
+        The value of the ``Content-Encoding`` header.
+    """
+    encoding = (encoding or 'identity').strip().lower()
+    if encoding == 'identity':
+        return None
+    elif encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    elif encoding == 'deflate':
+        return _Inflater().decompress
+    elif encoding == 'br' and brotli is not None:
+        decompressor = brotli.Decompressor()
+        # ``process`` in the brotli package, ``decompress`` in brotlicffi.
+        return getattr(decompressor, 'process', None) or \
+            decompressor.decompress
+    raise PytubeError("Unsupported content encoding: {}".format(encoding))
+
+
+class _Inflater(object):
+    """Decompresses a deflate body, with or without the zlib header (some
+    servers send raw deflate data).
+    """
+    def __init__(self):
+        self._decompressor = None
+        self._pending = b''
+
+    def decompress(self, data):
+        if self._decompressor is None:
+            # The two byte zlib header tells the formats apart, wait until
+            # it's complete before choosing.
+            data = self._pending + data
+            if len(data) < 2:
+                self._pending = data
+                return b''
+            self._pending = b''
+            self._decompressor = zlib.decompressobj()
+            try:
+                return self._decompressor.decompress(data)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(data)
+
+
+def open_url(url, headers=None, timeout=None, method=None):
+    """Opens a url once, without retrying.
+
+    :param str url:
+        The url to open.
+    :param dict headers:
+        Additional request headers.
+    :param float timeout:
+        The socket timeout in seconds.
+    :param str method:
+        The HTTP method (e.g.: HEAD), GET by default.
+    """
+    request = Request(url, headers=headers or {})
+    if method:
+        request.get_method = lambda: method
+    if timeout is None:
+        return _urlopen(request)
+    return _urlopen(request, timeout=timeout)
+
+
+def replace_host(url, host):
+    """Points a url to another host (e.g.: a stream's ``fallback_host``).
+
+    :param str url:
+        The original url.
+    :param str host:
+        The new host name (optionally including the port).
+    """
+    return urlunparse(urlparse(url)._replace(netloc=host))
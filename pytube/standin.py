@@ -0,0 +1,477 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""A local stand-in for YouTube, serving synthetic watch pages, a player
+script with a signature cipher and a media CDN with configurable latency,
+bandwidth, Range support and fault injection. It lets pytube be tested and
+load-tested without any access to the real site.
+"""
+from __future__ import unicode_literals
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse, parse_qs
+    from urllib import urlencode
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse, parse_qs, urlencode
+
+log = logging.getLogger(__name__)
+
+# The player script. ``Xv`` scrambles the signature the same way as
+# ``_cipher()`` below, through a helper object like YouTube's players do.
+PLAYER_JS = (
+    'var Qo={Wl:function(a){a.reverse()},'
+    'Ex:function(a,b){a.splice(0,b)},'
+    'VZ:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b]=c}};'
+    'function Xv(a){a=a.split("");Qo.VZ(a,7);Qo.Wl(a,3);Qo.Ex(a,2);'
+    'Qo.VZ(a,11);return a.join("")};'
+    '(function(c){var sig=c.sig||Xv(c.s);return sig})({s:"",sig:"0"});'
+)
+
+WATCH_HTML = (
+    '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+    '<title>{title} - YouTube</title>{restrictions}</head><body>'
+    '<div id="player"></div><script>var ytplayer = ytplayer || {{}};'
+    'ytplayer.config = {config};ytplayer.load = function() {{}};</script>'
+    '</body></html>'
+)
+
+# The profiles of the streams served by default: itag, mime type, quality.
+DEFAULT_STREAMS = (
+    (22, 'video/mp4', 'hd720'),
+    (18, 'video/mp4', 'medium'),
+    (43, 'video/webm', 'medium'),
+    (17, 'video/3gpp', 'small'),
+)
+
+# The adaptive (audio only or video only) streams served by default.
+DEFAULT_ADAPTIVE_STREAMS = (
+    (137, 'video/mp4', 'hd1080'),
+    (136, 'video/mp4', 'hd720'),
+    (248, 'video/webm', 'hd1080'),
+    (140, 'audio/mp4', None),
+    (251, 'audio/webm', None),
+)
+
+
+def _cipher(signature):
+    """The Python equivalent of the ``Xv`` function of ``PLAYER_JS``."""
+    def swap(a, b):
+        c = a[0]
+        a[0] = a[b % len(a)]
+        a[b] = c
+    a = list(signature)
+    swap(a, 7)
+    a.reverse()
+    a = a[2:]
+    swap(a, 11)
+    return ''.join(a)
+
+
+class StandInVideo(object):
+    """A video served by the :class:`StandInServer`."""
+    def __init__(self, video_id, title=None, size=1024 * 1024,
+                 streams=DEFAULT_STREAMS,
+                 adaptive_streams=DEFAULT_ADAPTIVE_STREAMS, audio_size=None,
+                 ciphered=True, age_restricted=False):
+        """Sets-up the video.
+
+        :param str video_id:
+            The id of the video.
+        :param str title:
+            The title of the video.
+        :param int size:
+            The size in bytes of every stream of the video.
+        :param streams:
+            The ``(itag, mime type, quality)`` of the streams.
+        :param adaptive_streams:
+            The ``(itag, mime type, quality)`` of the adaptive streams.
+        :param int audio_size:
+            The size in bytes of the audio only streams, a tenth of ``size``
+            by default.
+        :param bool ciphered:
+            Whether the stream urls need a signature deciphered by the player
+            script.
+        :param bool age_restricted:
+            Whether the watch page is age restricted.
+        """
+        self.video_id = video_id
+        self.title = title or 'Stand-in video {}'.format(video_id)
+        self.size = size
+        self.streams = streams
+        self.adaptive_streams = adaptive_streams
+        self.audio_size = size // 10 if audio_size is None else audio_size
+        self.ciphered = ciphered
+        self.age_restricted = age_restricted
+
+    def itags(self):
+        """Gets the itags of all streams."""
+        streams = list(self.streams) + list(self.adaptive_streams)
+        return [s[0] for s in streams]
+
+    def stream_size(self, itag):
+        """Gets the size in bytes of a stream."""
+        for stream_itag, mime_type, _ in self.adaptive_streams:
+            if stream_itag == itag and mime_type.startswith('audio/'):
+                return self.audio_size
+        return self.size
+
+    def scrambled_signature(self, itag):
+        """Gets the scrambled signature (the ``s`` parameter) of a stream."""
+        key = '{}:{}'.format(self.video_id, itag).encode('utf-8')
+        return hashlib.sha1(key).hexdigest().upper() + '.' + \
+            hashlib.md5(key).hexdigest().upper()
+
+    def signature(self, itag):
+        """Gets the signature expected by the media server for a stream."""
+        return _cipher(self.scrambled_signature(itag))
+
+    def pattern(self, itag):
+        """Gets the 256 bytes repeated to form the content of a stream."""
+        key = '{}:{}'.format(self.video_id, itag).encode('utf-8')
+        digest = b''.join(hashlib.sha256(key + bytearray([i])).digest()
+                          for i in range(8))
+        return digest
+
+    def content(self, itag, start=0, end=None):
+        """Gets the bytes ``start`` to ``end`` (exclusive) of a stream.
+
+        :param int itag:
+            The itag of the stream.
+        :param int start:
+            The offset of the first byte.
+        :param int end:
+            The offset after the last byte, the size of the stream if not
+            given.
+        """
+        end = self.stream_size(itag) if end is None else end
+        pattern = self.pattern(itag)
+        offset = start % len(pattern)
+        count = (end - start + offset) // len(pattern) + 1
+        return (pattern * count)[offset:offset + end - start]
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """A local HTTP server standing in for the watch pages, the player script
+    and the media CDN of YouTube.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, videos=None, host='127.0.0.1', port=0, latency=0,
+                 bandwidth=None, fault_rate=0, faults=('drop', 'error'),
+                 seed=None, compression=True, dropped_routes=()):
+        """Sets-up the server.
+
+        :param videos:
+            The :class:`StandInVideo` instances to serve.
+        :param str host:
+            The interface to listen on.
+        :param int port:
+            The port to listen on, any free port if 0.
+        :param float latency:
+            The delay in seconds before every response.
+        :param int bandwidth:
+            The maximum number of bytes per second sent on each media
+            connection. Unlimited if not given.
+        :param float fault_rate:
+            The probability (0-1) of a media request failing.
+        :param faults:
+            The kinds of faults to inject: ``drop`` closes the connection
+            halfway through the body and ``error`` responds with a 503.
+        :param int seed:
+            The seed of the fault injection, for reproducible runs.
+        :param bool compression:
+            Whether to compress the pages and the player script (never the
+            media) for clients accepting gzip or deflate.
+        :param dropped_routes:
+            The paths (e.g.: ``/get_video_info``) whose requests are answered
+            by closing the connection, to test the fallbacks.
+        """
+        HTTPServer.__init__(self, (host, port), StandInHandler)
+        self.videos = dict((v.video_id, v) for v in videos or ())
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.fault_rate = fault_rate
+        self.faults = faults
+        self.compression = compression
+        self.dropped_routes = set(dropped_routes)
+        self.stats = {'requests': {}, 'bytes_sent': 0, 'faults': 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Gets the url of the server."""
+        return 'http://{}:{}'.format(*self.server_address[:2])
+
+    @property
+    def netloc(self):
+        """Gets the ``host:port`` of the server."""
+        return '{}:{}'.format(*self.server_address[:2])
+
+    def add_video(self, video):
+        """Adds a :class:`StandInVideo` to serve."""
+        self.videos[video.video_id] = video
+        return video
+
+    def watch_url(self, video_id):
+        """Gets the watch url of a video."""
+        return '{}/watch?{}'.format(self.base_url, urlencode({'v': video_id}))
+
+    def start(self):
+        """Serves requests from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        args=(0.05,), name='pytube-standin')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket."""
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def record(self, route, bytes_sent=0, fault=False):
+        """Updates the request statistics."""
+        with self._lock:
+            requests = self.stats['requests']
+            requests[route] = requests.get(route, 0) + 1
+            self.stats['bytes_sent'] += bytes_sent
+            self.stats['faults'] += int(fault)
+
+    def pick_fault(self):
+        """Decides whether (and how) to fail the current media request."""
+        with self._lock:
+            if self.faults and self._random.random() < self.fault_rate:
+                return self._random.choice(self.faults)
+        return None
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Handles the requests of a :class:`StandInServer`."""
+
+    def do_GET(self):
+        parts = urlparse(self.path)
+        query = dict((k, v[0]) for k, v in parse_qs(parts.query).items())
+        route = {
+            '/watch': self.watch,
+            '/get_video_info': self.video_info,
+            '/player.js': self.player,
+            '/videoplayback': self.videoplayback,
+        }.get(parts.path)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if parts.path in self.server.dropped_routes:
+            self.server.record(parts.path, fault=True)
+            self.close_connection = True
+            return
+        if route is None:
+            self.server.record(parts.path)
+            self.send_error(404)
+            return
+        route(query)
+
+    def do_HEAD(self):
+        self._head_only = True
+        self.do_GET()
+
+    def watch(self, query):
+        video = self.server.videos.get(query.get('v'))
+        if video is None:
+            self.server.record('/watch')
+            self.send_error(404)
+            return
+        config = json.dumps({
+            'args': self.player_args(video),
+            'assets': {'js': '//{}/player.js'.format(self.server.netloc)},
+        })
+        restrictions = ''
+        if video.age_restricted:
+            restrictions = '<meta property="og:restrictions:age" ' \
+                           'content="18+">'
+        self.send_body('/watch', WATCH_HTML.format(
+            title=video.title, restrictions=restrictions,
+            config=config).encode('utf-8'), 'text/html; charset=utf-8')
+
+    def video_info(self, query):
+        """Serves the compact, form-encoded video info. Like YouTube's, it
+        doesn't point to the player script, nor describe age restricted
+        videos.
+        """
+        video = self.server.videos.get(query.get('video_id'))
+        if video is None:
+            info = {'status': 'fail', 'reason': 'Invalid parameters.'}
+        elif video.age_restricted:
+            info = {'status': 'fail', 'errorcode': '150',
+                    'reason': 'Sign in to confirm your age'}
+        else:
+            info = self.player_args(video)
+            info['status'] = 'ok'
+        self.send_body('/get_video_info',
+                       urlencode(sorted(info.items())).encode('utf-8'),
+                       'application/x-www-form-urlencoded')
+
+    def player_args(self, video):
+        """Gets the player arguments (video details and stream maps) of a
+        video.
+        """
+        return {
+            'video_id': video.video_id,
+            'title': video.title,
+            'loaderUrl': self.server.watch_url(video.video_id),
+            'url_encoded_fmt_stream_map': self.stream_map(
+                video, video.streams),
+            'adaptive_fmts': self.stream_map(
+                video, video.adaptive_streams, clen=True),
+        }
+
+    def stream_map(self, video, streams, clen=False):
+        """Encodes a stream map of a video like YouTube does, which only
+        announces the size (``clen``) of the adaptive streams.
+        """
+        encoded = []
+        for itag, mime_type, quality in streams:
+            params = {'itag': itag, 'id': video.video_id}
+            stream = {'itag': itag, 'type': mime_type,
+                      'fallback_host': self.server.netloc}
+            if quality:
+                stream['quality'] = quality
+            if clen:
+                stream['clen'] = video.stream_size(itag)
+            if video.ciphered:
+                stream['s'] = video.scrambled_signature(itag)
+            else:
+                params['signature'] = video.signature(itag)
+            stream['url'] = '{}/videoplayback?{}'.format(
+                self.server.base_url, urlencode(sorted(params.items())))
+            encoded.append(urlencode(sorted(stream.items())))
+        return ','.join(encoded)
+
+    def player(self, query):
+        self.send_body('/player.js', PLAYER_JS.encode('utf-8'),
+                       'application/javascript')
+
+    def videoplayback(self, query):
+        video = self.server.videos.get(query.get('id'))
+        try:
+            itag = int(query.get('itag'))
+        except (TypeError, ValueError):
+            itag = None
+        if video is None or itag not in video.itags():
+            self.server.record('/videoplayback')
+            self.send_error(404)
+            return
+        if query.get('signature') != video.signature(itag):
+            self.server.record('/videoplayback')
+            self.send_error(403)
+            return
+        fault = None if self.head_only else self.server.pick_fault()
+        if fault == 'error':
+            self.server.record('/videoplayback', fault=True)
+            self.send_error(503)
+            return
+
+        size = video.stream_size(itag)
+        start, end = 0, size
+        rng = self.headers.get('Range')
+        if rng and rng.startswith('bytes='):
+            first, _, last = rng[6:].partition('-')
+            start = int(first)
+            end = min(int(last) + 1 if last else size, size)
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(
+                start, end - 1, size))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(end - start))
+        self.send_header('Accept-Ranges', 'bytes')
+        if self.head_only:
+            # Recorded before the response is complete, so the stats are up
+            # to date as soon as the client has the headers.
+            self.server.record('/videoplayback')
+            self.end_headers()
+            return
+        self.end_headers()
+        if fault == 'drop':
+            end = start + (end - start) // 2
+        sent = self.send_media(video, itag, start, end)
+        self.server.record('/videoplayback', sent, fault=bool(fault))
+
+    def send_media(self, video, itag, start, end, chunk_size=64 * 1024):
+        """Writes the media bytes, throttled to the server's bandwidth."""
+        bandwidth = self.server.bandwidth
+        began = time.time()
+        sent = 0
+        try:
+            for offset in range(start, end, chunk_size):
+                chunk = video.content(itag, offset,
+                                      min(offset + chunk_size, end))
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                if bandwidth:
+                    ahead = sent / float(bandwidth) - (time.time() - began)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        except (IOError, OSError):
+            # The client went away.
+            pass
+        return sent
+
+    def send_body(self, route, body, content_type):
+        """Sends a complete response body, compressed if the client accepts
+        it and the server compresses.
+        """
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        encoding = self.pick_encoding()
+        if encoding:
+            wbits = 16 + zlib.MAX_WBITS if encoding == 'gzip' else \
+                zlib.MAX_WBITS
+            compressor = zlib.compressobj(6, zlib.DEFLATED, wbits)
+            body = compressor.compress(body) + compressor.flush()
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.server.record(route, len(body))
+        self.end_headers()
+        if not self.head_only:
+            self.wfile.write(body)
+
+    def pick_encoding(self):
+        """Picks the compression of a text response, ``None`` to send it
+        uncompressed.
+        """
+        if not self.server.compression:
+            return None
+        accepted = [e.split(';')[0].strip() for e in
+                    self.headers.get('Accept-Encoding', '').split(',')]
+        for encoding in ('gzip', 'deflate'):
+            if encoding in accepted:
+                return encoding
+        return None
+
+    @property
+    def head_only(self):
+        return getattr(self, '_head_only', False)
+
+    def log_message(self, fmt, *args):
+        log.debug(fmt, *args)
@@ -1,11 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import argparse
+import json
 import re
 
 from os import path
 from sys import stdout
-from time import clock
+
+try:  # Python 3.3+
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+from .exceptions import PytubeError
 
 
 class FullPaths(argparse.Action):
@@ -72,7 +79,9 @@ def sizeof(bytes):
 def print_status(progress, file_size, start):
     """
     This function - when passed as `on_progress` to `Video.download` - prints
-    out the current download progress.
+    out the current download progress. For multiple downloads, or to keep the
+    formatting off the download loop, use ``pytube.progress.ProgressReporter``
+    instead.
 
     :params progress: The lenght of the currently downloaded bytes.
     :params file_size: The total size of the video.
@@ -81,9 +90,86 @@ def print_status(progress, file_size, start):
 
     percentDone = int(progress) * 100. / file_size
     done = int(50 * progress / int(file_size))
-    dt = (clock() - start)
+    dt = (monotonic() - start)
     if dt > 0:
         stdout.write("\r  [%s%s][%3.2f%%] %s at %s/s\r " %
                      ('=' * done, ' ' * (50 - done), percentDone,
                       sizeof(file_size), sizeof(progress // dt)))
     stdout.flush()
+
+
+def extract_json(text, marker):
+    """Extracts the json object assigned after ``marker`` in a page (e.g.:
+    ``ytplayer.config = ``).
+
+    :params text: The raw text (html or javascript) of the page.
+    :params marker: The text immediately preceding the json object.
+    """
+    start = text.find(marker)
+    if start < 0:
+        raise PytubeError("Unable to find {!r} in page.".format(marker))
+    text = text[start + len(marker):]
+
+    offset = get_json_offset(text)
+    if not offset:
+        raise PytubeError("Unable to extract json.")
+    return json.loads(text[:offset])
+
+
+# The brackets counted to find the end of a json object.
+_BRACKETS = re.compile("[{}]")
+
+
+def extract_json_stream(chunks, marker):
+    """Extracts the json object assigned after ``marker`` from a page read in
+    chunks (see ``pytube.request.iter_text()``), without reading the rest of
+    the page once the object is closed. Returns the text read so far and the
+    decoded object, ``None`` if the marker isn't in the page.
+
+    :params chunks: An iterable of successive pieces of text of the page.
+    :params marker: The text immediately preceding the json object.
+    """
+    text = ''
+    start = None
+    depth = 0
+    scanned = 0
+    for chunk in chunks:
+        text += chunk
+        if start is None:
+            found = text.find(marker, max(0, scanned - len(marker)))
+            scanned = len(text)
+            if found < 0:
+                continue
+            start = scanned = found + len(marker)
+        # Same as ``get_json_offset()``: count the brackets until all js
+        # expressions are closed.
+        for match in _BRACKETS.finditer(text, scanned):
+            depth += 1 if match.group() == "{" else -1
+            if depth == 0:
+                end = match.end()
+                return text[:end], json.loads(text[start:end])
+        scanned = len(text)
+    if start is not None:
+        raise PytubeError("Unable to determine json offset.")
+    return text, None
+
+
+def get_json_offset(text):
+    """Find where the json object ends.
+
+    :params text: The text starting with a json object.
+    """
+    brackets = []
+    index = 1
+    # Determine the offset by pushing/popping brackets until all
+    # js expressions are closed.
+    for idx, ch in enumerate(text):
+        if ch == "{":
+            brackets.append("}")
+        elif ch == "}":
+            brackets.pop()
+            if len(brackets) == 0:
+                break
+    else:
+        raise PytubeError("Unable to determine json offset.")
+    return index + idx
@@ -0,0 +1,37 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+
+try:
+    from BaseHTTPServer import HTTPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import HTTPServer
+    from socketserver import ThreadingMixIn
+
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ServerTestCase(unittest.TestCase):
+    '''Base class for tests that run against a local server. Subclasses set
+    ``handler`` to the request handler class; the server listens on
+    ``host`` for the lifetime of the test class.'''
+
+    handler = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingServer(('127.0.0.1', 0), cls.handler)
+        cls.host = '127.0.0.1:%d' % cls.server.server_port
+        cls.base = 'http://' + cls.host
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import hashlib
+import shutil
+import tempfile
+import unittest
+import zlib
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+except ImportError:
+    from http.server import BaseHTTPRequestHandler
+
+from pytube import YouTube
+from pytube.exceptions import PytubeError
+from pytube.request import _get_decompressor, get
+from pytube.standin import StandInServer, StandInVideo
+from pytube.utils import extract_json_stream
+from tests.server import ServerTestCase
+
+TEXT = u'<html>ytplayer.config = {"args": {"title": "caf\xe9 {1}"}};' \
+    u'</script>' + u'<p>padding</p>' * 1000
+
+
+def compress(data, wbits):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, wbits)
+    return compressor.compress(data) + compressor.flush()
+
+
+class CorruptHandler(BaseHTTPRequestHandler):
+    '''Serves a body that isn't the gzip data it claims to be'''
+
+    def do_GET(self):
+        body = b'not gzip data'
+        self.send_response(200)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCompression(unittest.TestCase):
+    '''Test compressed transfers of the pages and the player script'''
+
+    def test_decompress_in_chunks(self):
+        data = TEXT.encode('utf-8')
+        for encoding, wbits in (('gzip', 16 + zlib.MAX_WBITS),
+                                ('deflate', zlib.MAX_WBITS),
+                                ('deflate', -zlib.MAX_WBITS)):
+            body = compress(data, wbits)
+            decompress = _get_decompressor(encoding)
+            chunks = [decompress(body[i:i + 7])
+                      for i in range(0, len(body), 7)]
+            self.assertEqual(b''.join(chunks), data)
+            # The format can't be told from a single byte.
+            decompress = _get_decompressor(encoding)
+            chunks = [decompress(body[:1]), decompress(body[1:])]
+            self.assertEqual(b''.join(chunks), data)
+        self.assertIsNone(_get_decompressor(None))
+        self.assertRaises(PytubeError, _get_decompressor, 'compress')
+
+    def test_extract_json_stream(self):
+        chunks = iter([TEXT[i:i + 5] for i in range(0, len(TEXT), 5)])
+        text, data = extract_json_stream(chunks, 'ytplayer.config = ')
+        self.assertEqual(data, {'args': {'title': u'caf\xe9 {1}'}})
+        self.assertTrue(text.endswith('"}}'))
+        # The rest of the page isn't read.
+        self.assertTrue(next(chunks))
+        self.assertEqual(extract_json_stream(['<html>'], 'marker'),
+                         ('<html>', None))
+        self.assertRaises(PytubeError, extract_json_stream,
+                          ['marker{"a": {'], 'marker')
+
+    def test_compressed_metadata(self):
+        video = StandInVideo('standin-001', size=64 * 1024)
+        path = tempfile.mkdtemp()
+        sent = []
+        try:
+            for compression in (False, True):
+                with StandInServer([video],
+                                   compression=compression) as server:
+                    yt = YouTube(server.watch_url('standin-001'))
+                    sent.append(server.stats['bytes_sent'])
+                    result = yt.select().download(path, force_overwrite=True,
+                                                  checksums=['sha1'])
+                    self.assertEqual(
+                        result.checksums['sha1'],
+                        hashlib.sha1(video.content(22)).hexdigest())
+        finally:
+            shutil.rmtree(path)
+        self.assertLess(sent[1] * 2, sent[0])
+
+
+
+class TestCorruptBody(ServerTestCase):
+    '''Test that a corrupt compressed body raises ``PytubeError``'''
+
+    handler = CorruptHandler
+
+    def test_corrupt_body(self):
+        with self.assertRaises(PytubeError):
+            get(self.base + '/page')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+except ImportError:
+    from http.server import BaseHTTPRequestHandler
+
+from pytube.exceptions import ChecksumMismatch, IncompleteDownload, \
+    PytubeError
+from pytube.models import Video, WriteBehindFile
+from pytube.request import RetryPolicy
+from tests.server import ServerTestCase
+
+PAYLOAD = os.urandom(64 * 1024)
+
+
+class MediaHandler(BaseHTTPRequestHandler):
+    '''Serves ``PAYLOAD``, or a truncated copy of it for ``/short``'''
+
+    def do_GET(self):
+        body = PAYLOAD[:1000] if self.path == '/short' else PAYLOAD
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload(ServerTestCase):
+    '''Test ``Video.download`` against a local server'''
+
+    handler = MediaHandler
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def video(self, route='/full'):
+        return Video(self.base + route, 'test', 'mp4', '720p', 'H.264',
+                     'High', '2-2.9', 'AAC', '192')
+
+    def test_checksums(self):
+        finished = []
+        result = self.video().download(
+            self.path, checksums=['sha256', 'md5'],
+            on_finish=lambda *args: finished.append(args))
+        self.assertEqual(result.bytes_received, len(PAYLOAD))
+        self.assertEqual(result.checksums['sha256'],
+                         hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(result.checksums['md5'],
+                         hashlib.md5(PAYLOAD).hexdigest())
+        self.assertEqual(finished, [(result.path, result.checksums)])
+
+    def test_expected_checksum(self):
+        digest = hashlib.sha1(PAYLOAD).hexdigest()
+        result = self.video().download(self.path, checksums={'sha1': digest})
+        self.assertEqual(result.checksums['sha1'], digest)
+
+    def test_checksum_mismatch(self):
+        with self.assertRaises(ChecksumMismatch):
+            self.video().download(self.path, checksums={'sha1': '0' * 40})
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_truncated(self):
+        with self.assertRaises(IncompleteDownload):
+            self.video('/short').download(
+                self.path, retry_policy=RetryPolicy(retries=2, backoff=0))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_byte_range_not_supported(self):
+        with self.assertRaises(PytubeError):
+            self.video().download(self.path, byte_range=(0, 99))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_open_error(self):
+        video = self.video()
+
+        def open_file(path):
+            raise IOError('disk offline')
+        video._open_file = open_file
+        with self.assertRaises(IOError) as context:
+            video.download(self.path)
+        self.assertEqual(str(context.exception), 'disk offline')
+        with self.assertRaises(IOError) as context:
+            video.download_ranges([(0, 99)], self.path)
+        self.assertEqual(str(context.exception), 'disk offline')
+
+    def test_write_behind(self):
+        result = self.video().download(
+            self.path, checksums=['sha256'], chunk_size=1000,
+            write_behind={'buffer_size': 4096, 'buffers': 2})
+        with open(result.path, 'rb') as fh:
+            self.assertEqual(fh.read(), PAYLOAD)
+
+    def test_write_behind_truncated(self):
+        with self.assertRaises(IncompleteDownload):
+            self.video('/short').download(
+                self.path, write_behind=True,
+                retry_policy=RetryPolicy(retries=0))
+        self.assertEqual(os.listdir(self.path), [])
+
+
+class FailingFile(io.BytesIO):
+    def write(self, data):
+        raise IOError('disk full')
+
+
+class TestWriteBehindFile(unittest.TestCase):
+    '''Test the write-behind file wrapper'''
+
+    def test_coalescing(self):
+        writes = []
+
+        class RecordingFile(io.BytesIO):
+            def write(self, data):
+                writes.append(len(data))
+                return io.BytesIO.write(self, data)
+        raw = RecordingFile()
+        dst = WriteBehindFile(raw, buffer_size=100, buffers=2)
+        for _ in range(25):
+            dst.write(b'x' * 10)
+        dst.close()
+        self.assertEqual(raw.getvalue(), b'x' * 250)
+        self.assertEqual(writes, [100, 100, 50])
+
+    def test_restart(self):
+        raw = io.BytesIO()
+        dst = WriteBehindFile(raw, buffer_size=8)
+        dst.write(b'abcdefghij')
+        dst.seek(0)
+        dst.truncate()
+        dst.write(b'xyz')
+        dst.close()
+        self.assertEqual(raw.getvalue(), b'xyz')
+
+    def test_error(self):
+        dst = WriteBehindFile(FailingFile(), buffer_size=4)
+        dst.write(b'abcd')
+        with self.assertRaises(IOError):
+            dst.close()
+
+    def test_discard(self):
+        writing = threading.Event()
+        release = threading.Event()
+
+        class BlockingFile(io.BytesIO):
+            def write(self, data):
+                writing.set()
+                release.wait()
+                return io.BytesIO.write(self, data)
+        raw = BlockingFile()
+        dst = WriteBehindFile(raw, buffer_size=4)
+        dst.write(b'abcdefghijkl')
+        writing.wait()
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        dst.close(discard=True)
+        timer.join()
+        # Only the buffer already being written reaches the file.
+        self.assertEqual(raw.getvalue(), b'abcd')
+
+
+if __name__ == '__main__':
+    unittest.main()
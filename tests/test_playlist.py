@@ -0,0 +1,115 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from urlparse import urlparse, parse_qs
+    from urllib2 import HTTPError
+except ImportError:
+    from http.server import BaseHTTPRequestHandler
+    from urllib.parse import urlparse, parse_qs
+    from urllib.error import HTTPError
+
+from pytube import Playlist
+from pytube.exceptions import PytubeError
+from tests.server import ServerTestCase
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name)) as fh:
+        return fh.read()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    '''Serves the stored playlist, continuation and watch page fixtures'''
+
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        parts = urlparse(self.path)
+        query = parse_qs(parts.query)
+        host = self.headers.get('Host')
+        if parts.path == '/playlist' and query['list'] == ['PLfixture']:
+            body = fixture('playlist.html')
+        elif parts.path == '/browse_ajax':
+            assert query['continuation'] == ['page2token']
+            body = fixture('playlist_continuation.json')
+        elif parts.path == '/watch':
+            body = fixture('watch.html').replace('{host}', host).replace(
+                '{video_id}', query['v'][0])
+        elif parts.path == '/videoplayback':
+            body = query['id'][0] * 100
+        else:
+            self.send_error(404)
+            return
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPlaylist(ServerTestCase):
+    '''Test playlist enumeration and pipelined resolution against stored
+    fixture pages'''
+
+    handler = FixtureHandler
+
+    def setUp(self):
+        del FixtureHandler.requests[:]
+        self.url = self.base + '/playlist?list=PLfixture'
+        self.playlist = Playlist(self.url)
+        self.ids = ['vid-0000%d' % i for i in range(1, 6)]
+
+    def test_playlist_id(self):
+        self.assertEqual(self.playlist.playlist_id, 'PLfixture')
+        with self.assertRaises(PytubeError):
+            Playlist('https://www.youtube.com/watch?v=Ik-RsDGPI5Y')
+
+    def test_video_ids(self):
+        # The continuation also lists a deleted video, which has no id.
+        self.assertEqual(list(self.playlist.video_ids()), self.ids)
+        data = {'contents': [{'playlistVideoRenderer': {}},
+                             {'playlistVideoRenderer': {'videoId': 'a'}}]}
+        self.assertEqual(self.playlist._parse_page(data), (['a'], None))
+
+    def test_streaming(self):
+        video_ids = self.playlist.video_ids()
+        self.assertEqual(next(video_ids), 'vid-00001')
+        # The continuation isn't fetched until the first page is consumed.
+        self.assertEqual(len(FixtureHandler.requests), 1)
+
+    def test_resolve(self):
+        resolved = list(self.playlist.resolve(workers=3))
+        self.assertEqual(sorted(yt.video_id for yt in resolved), self.ids)
+        for yt in resolved:
+            self.assertEqual(yt.title, 'Fixture %s' % yt.video_id)
+            self.assertEqual(len(yt.get_videos()), 2)
+
+    def test_download(self):
+        path = tempfile.mkdtemp()
+        try:
+            results = list(self.playlist.download(path, workers=2))
+            self.assertEqual(len(results), 5)
+            self.assertEqual(sorted(os.listdir(path)), sorted(
+                'Fixture %s.mp4' % video_id for video_id in self.ids))
+        finally:
+            shutil.rmtree(path)
+
+    def test_error(self):
+        playlist = Playlist(self.url.replace('PLfixture', 'PLmissing'))
+        with self.assertRaises(HTTPError):
+            list(playlist.resolve())
+
+if __name__ == '__main__':
+    unittest.main()
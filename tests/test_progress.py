@@ -0,0 +1,80 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import io
+import json
+import unittest
+
+from pytube.progress import ProgressReporter
+
+
+class TestProgressReporter(unittest.TestCase):
+    '''Test the aggregated progress reporter without any network access'''
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.reporter = ProgressReporter(stream=self.stream, fmt='json')
+
+    def test_totals(self):
+        a = self.reporter.track('a')
+        b = self.reporter.track('b', 200)
+        a(50, 100)
+        b(25, 200)
+        self.assertEqual(self.reporter.totals(), (75, 300))
+
+    def test_totals_unknown_size(self):
+        self.reporter.track('a')
+        self.assertEqual(self.reporter.totals(), (0, None))
+
+    def test_json_lines(self):
+        task = self.reporter.track('a', 10)
+        task(10, 10)
+        task.finish('/tmp/a.mp4')
+        self.reporter.render(final=True)
+        state = json.loads(self.stream.getvalue().splitlines()[-1])
+        self.assertEqual(state['bytes_received'], 10)
+        self.assertTrue(state['final'])
+        self.assertTrue(state['tasks'][0]['finished'])
+
+    def test_discard_finished(self):
+        reporter = ProgressReporter(stream=self.stream, fmt='json',
+                                    discard_finished=True)
+        a = reporter.track('a', 10)
+        b = reporter.track('b', 20)
+        a(10, 10)
+        b(5, 20)
+        a.finish()
+        reporter.render()
+        state = json.loads(self.stream.getvalue().splitlines()[-1])
+        self.assertEqual([t['name'] for t in state['tasks']], ['a', 'b'])
+        self.assertEqual(reporter.totals(), (5, 20))
+        reporter.render()
+        state = json.loads(self.stream.getvalue().splitlines()[-1])
+        self.assertEqual([t['name'] for t in state['tasks']], ['b'])
+        self.assertGreaterEqual(reporter.rate, 0)
+
+    def test_untrack(self):
+        a = self.reporter.track('a', 10)
+        self.reporter.track('b', 20)
+        self.reporter.untrack(a)
+        self.assertEqual(self.reporter.totals(), (0, 20))
+
+    def test_background_thread(self):
+        self.reporter.interval = 0.01
+        task = self.reporter.track('a', 10)
+        with self.reporter:
+            task(5, 10)
+        lines = self.stream.getvalue().splitlines()
+        self.assertTrue(json.loads(lines[-1])['final'])
+
+    def test_bar(self):
+        reporter = ProgressReporter(stream=self.stream, width=10)
+        reporter.track('a', 100)(50, 100)
+        reporter.render()
+        self.assertIn('[=====     ][50.00%]', self.stream.getvalue())
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            ProgressReporter(fmt='xml')
+
+if __name__ == '__main__':
+    unittest.main()
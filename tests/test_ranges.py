@@ -0,0 +1,79 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from pytube import YouTube
+from pytube.request import RetryPolicy
+from pytube.standin import StandInServer, StandInVideo
+
+
+class TestRanges(unittest.TestCase):
+    '''Test partial byte-range downloads against the stand-in server'''
+
+    def setUp(self):
+        self.video = StandInVideo('ranges', size=100 * 1024)
+        self.server = StandInServer([self.video], seed=1).start()
+        self.yt = YouTube(self.server.watch_url('ranges'))
+        self.stream = self.yt.select({'extension': 'mp4'})
+        self.content = self.video.content(self.stream.itag)
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.path)
+
+    def read(self, path):
+        with open(path, 'rb') as fh:
+            return fh.read()
+
+    def test_byte_range(self):
+        progress = []
+        result = self.stream.download(
+            self.path, byte_range=(1000, 4999),
+            on_progress=lambda r, s, _: progress.append((r, s)))
+        self.assertEqual(self.read(result.path), self.content[1000:5000])
+        self.assertEqual(result.file_size, 4000)
+        self.assertEqual(progress[-1], (4000, 4000))
+
+    def test_open_ended_range(self):
+        result = self.stream.download(self.path, byte_range=(90000, None))
+        self.assertEqual(self.read(result.path), self.content[90000:])
+
+    def test_whole_video_range(self):
+        result = self.stream.download(self.path, byte_range=(0, None))
+        self.assertEqual(self.read(result.path), self.content)
+        self.assertEqual(result.file_size, len(self.content))
+
+    def test_range_resume(self):
+        self.server.fault_rate = 0.5
+        self.server.faults = ('drop',)
+        policy = RetryPolicy(retries=20, backoff=0)
+        result = self.stream.download(self.path, byte_range=(0, 49999),
+                                      retry_policy=policy)
+        self.assertEqual(self.read(result.path), self.content[:50000])
+
+    def test_ranges_to_buffers(self):
+        progress = []
+        buffers = self.stream.download_ranges(
+            [(0, 99), (50000, 50099), (102300, None)],
+            on_progress=lambda r, s, _: progress.append((r, s)))
+        self.assertEqual(buffers, [self.content[:100],
+                                   self.content[50000:50100],
+                                   self.content[102300:]])
+        self.assertEqual(progress[-1][0], 300)
+
+    def test_ranges_to_sparse_file(self):
+        result = self.stream.download_ranges([(0, 99), (50000, 50099)],
+                                             self.path)
+        data = self.read(result.path)
+        self.assertEqual(len(data), 50100)
+        self.assertEqual(data[:100], self.content[:100])
+        self.assertEqual(data[50000:], self.content[50000:50100])
+        self.assertEqual(result.bytes_received, 200)
+        self.assertEqual(os.listdir(self.path), ['Stand-in video ranges.mp4'])
+
+if __name__ == '__main__':
+    unittest.main()
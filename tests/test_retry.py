@@ -0,0 +1,151 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import socket
+import tempfile
+import time
+import unittest
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from urllib2 import HTTPError
+except ImportError:
+    from http.server import BaseHTTPRequestHandler
+    from urllib.error import HTTPError
+
+from pytube.models import Video
+from pytube.request import RetryPolicy, urlopen
+from tests.server import ServerTestCase
+
+PAYLOAD = os.urandom(256 * 1024)
+
+
+class FaultyHandler(BaseHTTPRequestHandler):
+    '''Serves ``PAYLOAD`` with Range support, injecting faults on the first
+    request(s) depending on the path'''
+
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get('Range')))
+        attempt = len(self.requests)
+        if self.path == '/unavailable' and attempt <= 2:
+            self.send_error(503)
+            return
+        if self.path == '/missing':
+            self.send_error(404)
+            return
+        if self.path == '/stall' and attempt == 1:
+            # Accept the connection but never respond in time.
+            time.sleep(0.5)
+            return
+        start = 0
+        rng = self.headers.get('Range')
+        if rng and self.path != '/norange':
+            start = int(rng.split('=')[1].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (
+                start, len(PAYLOAD) - 1, len(PAYLOAD)))
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:]
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.path in ('/flaky', '/norange', '/stallbody') and \
+                attempt == 1:
+            # Drop (or stall) the connection halfway through the body.
+            self.wfile.write(body[:len(body) // 2])
+            if self.path == '/stallbody':
+                self.wfile.flush()
+                time.sleep(0.5)
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRetry(ServerTestCase):
+    '''Test retries, resumption and failover against a fault injecting
+    local server'''
+
+    handler = FaultyHandler
+
+    def setUp(self):
+        del FaultyHandler.requests[:]
+        self.path = tempfile.mkdtemp()
+        self.policy = RetryPolicy(retries=3, backoff=0, timeout=0.2)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def video(self, url, fallback_host=None):
+        return Video(url, 'test', 'mp4', '720p', 'H.264', 'High', '2-2.9',
+                     'AAC', '192', fallback_host=fallback_host,
+                     retry_policy=self.policy)
+
+    def read(self, result):
+        with open(result.path, 'rb') as fh:
+            return fh.read()
+
+    def test_delays(self):
+        policy = RetryPolicy(retries=4, backoff=1, max_backoff=3,
+                             jitter=False)
+        self.assertEqual(list(policy.delays()), [1, 2, 3, 3])
+        policy.jitter = True
+        for delay, limit in zip(policy.delays(), [1, 2, 3, 3]):
+            self.assertTrue(0 <= delay <= limit)
+
+    def test_resume(self):
+        url = 'http://%s/flaky' % self.host
+        result = self.video(url).download(self.path)
+        self.assertEqual(self.read(result), PAYLOAD)
+        self.assertEqual(len(FaultyHandler.requests), 2)
+        self.assertTrue(FaultyHandler.requests[1][1].startswith('bytes='))
+
+    def test_range_not_honored(self):
+        url = 'http://%s/norange' % self.host
+        result = self.video(url).download(self.path, checksums=['md5'])
+        self.assertEqual(self.read(result), PAYLOAD)
+
+    def test_server_error(self):
+        url = 'http://%s/unavailable' % self.host
+        result = self.video(url).download(self.path)
+        self.assertEqual(self.read(result), PAYLOAD)
+        self.assertEqual(len(FaultyHandler.requests), 3)
+
+    def test_permanent_error(self):
+        url = 'http://%s/missing' % self.host
+        with self.assertRaises(HTTPError):
+            urlopen(url, retry_policy=self.policy)
+        self.assertEqual(len(FaultyHandler.requests), 1)
+
+    def test_fallback_host(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        dead = 'http://127.0.0.1:%d/full' % sock.getsockname()[1]
+        sock.close()
+        result = self.video(dead, fallback_host=self.host).download(self.path)
+        self.assertEqual(self.read(result), PAYLOAD)
+
+    def test_fetch_retry(self):
+        url = 'http://%s/unavailable' % self.host
+        self.assertEqual(urlopen(url, retry_policy=self.policy).read(),
+                         PAYLOAD)
+
+    def test_stalled_response(self):
+        url = 'http://%s/stall' % self.host
+        self.assertEqual(urlopen(url, retry_policy=self.policy).read(),
+                         PAYLOAD)
+        # The single threaded server may still be stalled on a retry.
+        self.assertGreaterEqual(len(FaultyHandler.requests), 2)
+
+    def test_stalled_download(self):
+        url = 'http://%s/stallbody' % self.host
+        result = self.video(url).download(self.path)
+        self.assertEqual(self.read(result), PAYLOAD)
+        self.assertTrue(FaultyHandler.requests[1][1].startswith('bytes='))
+
+if __name__ == '__main__':
+    unittest.main()
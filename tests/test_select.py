@@ -0,0 +1,127 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+import unittest
+import warnings
+
+from pytube import ResolvedVideo, YouTube
+from pytube.api import YT_QUALITY_PROFILES, YT_QUALITY_PROFILE_KEYS, \
+    YT_QUALITY_RANKS
+from pytube.exceptions import DoesNotExist
+
+
+class TestSelect(unittest.TestCase):
+    '''Test ranked stream selection without any network access'''
+
+    def setUp(self):
+        self.yt = YouTube()
+        for itag in (5, 17, 18, 22, 43, 85, 137, 140, 251):
+            profile = dict(zip(YT_QUALITY_PROFILE_KEYS,
+                               YT_QUALITY_PROFILES[itag]))
+            self.yt._add_video('http://localhost/%d' % itag, 'test',
+                               itag=itag, quality=YT_QUALITY_RANKS[itag],
+                               adaptive=itag > 100, **profile)
+
+    def test_ranks(self):
+        self.assertEqual(YT_QUALITY_RANKS[22], (720, 2.9, 192))
+        self.assertEqual(YT_QUALITY_RANKS[100], (360, None, 128))
+
+    def test_sorted_numerically(self):
+        mp4 = self.yt.filter('mp4')
+        self.assertEqual([v.itag for v in mp4], [18, 22, 85])
+        self.assertEqual(max(mp4).resolution, '1080p')
+
+    def test_best(self):
+        self.assertEqual(self.yt.select().itag, 85)
+
+    def test_ranked_preferences(self):
+        video = self.yt.select({'extension': 'mp4', 'max_resolution': 720},
+                               {})
+        self.assertEqual(video.itag, 22)
+        video = self.yt.select({'extension': 'mkv'},
+                               {'extension': 'webm'}, {})
+        self.assertEqual(video.itag, 43)
+
+    def test_lowest(self):
+        video = self.yt.select({'min_resolution': '240p',
+                                'prefer': 'lowest'})
+        self.assertEqual(video.itag, 5)
+
+    def test_bitrate(self):
+        video = self.yt.select({'max_video_bitrate': 0.5})
+        self.assertEqual(video.itag, 43)
+
+    def test_adaptive(self):
+        self.assertEqual(self.yt.select({'is_audio_only': True}).itag, 251)
+        self.assertEqual(self.yt.select({'is_video_only': True}).itag, 137)
+        self.assertEqual(
+            self.yt.select({'is_audio_only': True, 'prefer': 'lowest'}).itag,
+            140)
+        self.assertEqual(len(self.yt.get_videos()), 6)
+        self.assertEqual(len(self.yt.get_videos(adaptive=True)), 9)
+
+    def test_no_match(self):
+        with self.assertRaises(DoesNotExist):
+            self.yt.select({'resolution': '4320p'})
+
+    def test_unknown_criteria(self):
+        with self.assertRaises(TypeError):
+            self.yt.select({'colour': 'blue'})
+
+    def test_set_filename(self):
+        self.yt.set_filename('renamed')
+        self.assertEqual(
+            set(v.filename for v in self.yt.get_videos(adaptive=True)),
+            set(['renamed']))
+
+    def test_deprecated_videos(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertEqual(self.yt.videos, self.yt.get_videos())
+
+    def test_snapshot(self):
+        snapshot = self.yt.snapshot()
+        self.assertEqual(len(snapshot.get_videos()), 6)
+        self.assertEqual(snapshot.select().itag, 85)
+        self.assertEqual(
+            snapshot.select({'is_audio_only': True}).itag, 251)
+        with self.assertRaises(AttributeError):
+            snapshot.title = 'changed'
+        with self.assertRaises(AttributeError):
+            snapshot.select().filename = 'changed'
+        self.assertFalse(self.yt.select().frozen)
+        # The snapshot doesn't follow later changes to the instance.
+        self.yt.set_filename('changed')
+        self.assertEqual(snapshot.select().filename, 'test')
+        variant = snapshot.with_filename('variant')
+        self.assertEqual(
+            set(v.filename for v in variant.get_videos(adaptive=True)),
+            set(['variant']))
+        self.assertEqual(snapshot.select().filename, 'test')
+        self.assertTrue(variant.select().frozen)
+
+    def test_copy_snapshot(self):
+        snapshot = self.yt.snapshot()
+        for clone in (copy.copy(snapshot), copy.deepcopy(snapshot),
+                      pickle.loads(pickle.dumps(snapshot))):
+            self.assertIsInstance(clone, ResolvedVideo)
+            self.assertEqual(clone.to_dict(), snapshot.to_dict())
+            self.assertTrue(all(v.frozen for v in clone.videos))
+            with self.assertRaises(AttributeError):
+                clone.title = 'changed'
+            with self.assertRaises(AttributeError):
+                clone.select().filename = 'changed'
+
+    def test_snapshot_dict(self):
+        snapshot = self.yt.snapshot()
+        data = snapshot.to_dict()
+        self.assertEqual(data, self.yt.to_dict())
+        restored = ResolvedVideo.from_dict(data)
+        self.assertEqual(restored.to_dict(), data)
+        self.assertTrue(restored.select().frozen)
+        self.assertEqual(YouTube.from_dict(data).snapshot().to_dict(), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+
+from pytube import YouTube
+from pytube.exceptions import PytubeError
+from pytube.request import SingleFlight
+from pytube.standin import StandInServer, StandInVideo
+
+
+class TestSingleFlight(unittest.TestCase):
+    '''Test the coalescing of concurrent identical fetches'''
+
+    def run_threads(self, target, count=8):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_coalesce(self):
+        flight = SingleFlight()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'page'
+        self.run_threads(lambda: results.append(flight.call('key', fetch)))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['page'] * 8)
+        # Completed calls aren't cached.
+        flight.call('key', fetch)
+        self.assertEqual(len(calls), 2)
+
+    def test_shared_error(self):
+        flight = SingleFlight()
+        errors = []
+
+        def fail():
+            time.sleep(0.2)
+            raise ValueError('unavailable')
+
+        def call():
+            try:
+                flight.call('key', fail)
+            except ValueError as e:
+                errors.append(e)
+        self.run_threads(call)
+        self.assertEqual(len(errors), 8)
+
+    def test_aborted_leader(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        class Abort(BaseException):
+            pass
+
+        def abort():
+            started.set()
+            time.sleep(0.2)
+            raise Abort()
+
+        def lead():
+            try:
+                flight.call('key', abort)
+            except Abort as e:
+                errors.append(e)
+
+        def wait():
+            try:
+                flight.call('key', lambda: 'page')
+            except PytubeError as e:
+                errors.append(e)
+        leader = threading.Thread(target=lead)
+        leader.start()
+        started.wait()
+        self.run_threads(wait, count=2)
+        leader.join()
+        self.assertEqual(sorted(type(e).__name__ for e in errors),
+                         ['Abort', 'PytubeError', 'PytubeError'])
+
+    def test_cold_burst(self):
+        with StandInServer([StandInVideo('standin-001', size=1024)],
+                           latency=0.2) as server:
+            url = server.watch_url('standin-001')
+            resolved = []
+            self.run_threads(lambda: resolved.append(YouTube(url)))
+            self.assertEqual(len(resolved), 8)
+            self.assertEqual(server.stats['requests'],
+                             {'/watch': 1, '/player.js': 1})
+            self.assertEqual(
+                set(len(yt.get_videos(adaptive=True)) for yt in resolved),
+                set([9]))
+
+
+if __name__ == '__main__':
+    unittest.main()
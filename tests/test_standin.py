@@ -0,0 +1,275 @@
+#!/usr/bin/env/python
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from pytube import YouTube
+from pytube.exceptions import AgeRestricted, PytubeError
+from pytube.jsinterp import JSInterpreter
+from pytube.loadtest import SlowFile, percentile, run
+from pytube.models import Video
+from pytube.request import RetryPolicy
+from pytube.standin import PLAYER_JS, StandInServer, StandInVideo, _cipher
+
+
+class TestStandIn(unittest.TestCase):
+    '''Test pytube end-to-end against the local stand-in server'''
+
+    def setUp(self):
+        self.video = StandInVideo('standin-001', size=200 * 1024)
+        self.server = StandInServer([
+            self.video,
+            StandInVideo('plain', ciphered=False, size=1024),
+            StandInVideo('adult', age_restricted=True),
+        ], seed=1).start()
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.path)
+
+    def test_cipher(self):
+        signature = self.video.scrambled_signature(22)
+        jsi = JSInterpreter(PLAYER_JS)
+        self.assertEqual(jsi.extract_function('Xv')([signature]),
+                         _cipher(signature))
+
+    def test_profile_cipher(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        signature = self.video.scrambled_signature(22)
+        result, jsi = yt.profile_cipher(signature, trace=True)
+        self.assertEqual(result, self.video.signature(22))
+        self.assertEqual(jsi.functions['Xv'][0], 1)
+        self.assertEqual(jsi.functions['Qo.VZ'][0], 2)
+        self.assertGreater(jsi.statements, 0)
+        self.assertGreater(jsi.max_depth, 1)
+        self.assertTrue(any(label.startswith('interpret_expression:')
+                            for label in jsi.matches))
+        self.assertIn('Xv', jsi.report())
+        self.assertIn('a.join("") => ', jsi.format_trace())
+        # A broken player is reported rather than raised.
+        yt._js_code = PLAYER_JS.replace('a.reverse()', 'a.rev(}')
+        result, jsi = yt.profile_cipher(signature)
+        self.assertIsNone(result)
+        self.assertRaises(ValueError, jsi.format_trace)
+
+    def test_resolve_and_download(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        self.assertEqual(yt.title, self.video.title)
+        self.assertEqual(sorted(v.itag for v in yt.get_videos()),
+                         [17, 18, 22, 43])
+        result = yt.select().download(self.path, checksums=['sha1'])
+        self.assertEqual(result.checksums['sha1'],
+                         hashlib.sha1(self.video.content(22)).hexdigest())
+
+    def test_adaptive(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        adaptive = [v for v in yt.get_videos(adaptive=True) if v.adaptive]
+        self.assertEqual(sorted(v.itag for v in adaptive),
+                         [136, 137, 140, 248, 251])
+        audio = yt.select({'is_audio_only': True, 'extension': 'm4a'})
+        self.assertEqual(audio.itag, 140)
+        result = audio.download(self.path)
+        self.assertEqual(result.bytes_received, self.video.audio_size)
+
+    def test_download_tracks(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        audio, video = yt.download_tracks(self.path)
+        self.assertTrue(audio.path.endswith('.audio.webm'))
+        self.assertTrue(video.path.endswith('.video.mp4'))
+        self.assertEqual(audio.bytes_received, self.video.audio_size)
+        self.assertEqual(video.bytes_received, self.video.size)
+
+    def test_download_tracks_default_path(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        cwd = os.getcwd()
+        os.chdir(self.path)
+        try:
+            audio, video = yt.download_tracks()
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(sorted(os.listdir(self.path)), sorted(
+            [os.path.basename(audio.path), os.path.basename(video.path)]))
+        self.assertTrue(audio.path.endswith('.audio.webm'))
+        self.assertTrue(video.path.endswith('.video.mp4'))
+
+    def test_download_tracks_file_path(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        audio, video = yt.download_tracks(os.path.join(self.path, 'out.mp4'))
+        self.assertEqual(sorted(os.listdir(self.path)),
+                         ['out.audio.webm', 'out.video.mp4'])
+        self.assertEqual(audio.bytes_received, self.video.audio_size)
+        self.assertEqual(video.bytes_received, self.video.size)
+
+    def test_resolve_again(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        yt.from_url(self.server.watch_url('plain'))
+        self.assertEqual(len(yt.get_videos(adaptive=True)), 9)
+        self.assertEqual(yt.title, 'Stand-in video plain')
+        self.assertEqual(yt.snapshot().video_id, 'plain')
+
+    def test_shared_snapshot_download(self):
+        snapshot = YouTube(self.server.watch_url('standin-001')).snapshot()
+        video = snapshot.select({'extension': 'mp4'})
+        results, errors = [], []
+
+        def download(path):
+            try:
+                results.append(video.download(path, chunk_size=1024))
+            except Exception as e:
+                errors.append(e)
+        paths = [os.path.join(self.path, str(i)) for i in range(4)]
+        threads = []
+        for path in paths:
+            os.mkdir(path)
+            threads.append(threading.Thread(target=download, args=(path,)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        digest = hashlib.sha1(self.video.content(22)).hexdigest()
+        for result in results:
+            self.assertEqual(result.bytes_received, self.video.size)
+            with open(result.path, 'rb') as fh:
+                self.assertEqual(hashlib.sha1(fh.read()).hexdigest(), digest)
+        # Probing works, but doesn't change the shared video.
+        self.assertEqual(video.probe_size(), self.video.size)
+        self.assertIsNone(video.filesize)
+
+    def test_probe_sizes(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        # The adaptive streams announce their size in the stream map.
+        self.assertEqual(yt.select({'is_audio_only': True}).filesize,
+                         self.video.audio_size)
+        self.assertIsNone(yt.select().filesize)
+        sizes = yt.probe_sizes()
+        self.assertEqual(len(sizes), 9)
+        self.assertEqual(sizes[22], self.video.size)
+        self.assertEqual(sizes[140], self.video.audio_size)
+        # Only the four muxed streams were requested.
+        self.assertEqual(self.server.stats['requests']['/videoplayback'], 4)
+        yt.probe_sizes()
+        self.assertEqual(self.server.stats['requests']['/videoplayback'], 4)
+        video = yt.select({'max_filesize': self.video.size - 1,
+                           'adaptive': True})
+        self.assertTrue(video.is_audio_only)
+
+    def test_unciphered(self):
+        yt = YouTube(self.server.watch_url('plain'))
+        self.assertEqual(yt.select().download(self.path).bytes_received,
+                         1024)
+        self.assertNotIn('/player.js', self.server.stats['requests'])
+
+    def test_snapshot(self):
+        yt = YouTube(self.server.watch_url('standin-001'))
+        requests = dict(self.server.stats['requests'])
+        data = yt.to_bytes()
+        self.assertLess(len(data), len(json.dumps(yt.to_dict())))
+        clone = YouTube.from_bytes(data)
+        self.assertEqual(self.server.stats['requests'], requests)
+        self.assertEqual(clone.to_dict(), yt.to_dict())
+        self.assertEqual(clone.video_id, 'standin-001')
+        self.assertEqual(clone.title, yt.title)
+        self.assertEqual([v.quality for v in clone.get_videos(adaptive=True)],
+                         [v.quality for v in yt.get_videos(adaptive=True)])
+        result = clone.select().download(self.path, checksums=['sha1'])
+        self.assertEqual(result.checksums['sha1'],
+                         hashlib.sha1(self.video.content(22)).hexdigest())
+        self.assertRaises(PytubeError, YouTube.from_bytes, b'\x00' + data)
+        self.assertRaises(PytubeError, YouTube.from_bytes, data[:10])
+
+    def test_video_info(self):
+        yt = YouTube(self.server.watch_url('plain'), video_info=True)
+        self.assertEqual(yt.title, 'Stand-in video plain')
+        self.assertEqual(len(yt.get_videos(adaptive=True)), 9)
+        self.assertEqual(yt.select().download(self.path).bytes_received,
+                         1024)
+        self.assertNotIn('/watch', self.server.stats['requests'])
+
+    def test_video_info_fallback(self):
+        # Ciphered streams need the player script of the watch page.
+        yt = YouTube(self.server.watch_url('standin-001'), video_info=True)
+        self.assertEqual(len(yt.get_videos()), 4)
+        self.assertEqual(self.server.stats['requests']['/watch'], 1)
+        self.assertRaises(AgeRestricted, YouTube,
+                          self.server.watch_url('adult'), video_info=True)
+        self.assertEqual(self.server.stats['requests']['/get_video_info'], 2)
+
+    def test_video_info_unreachable(self):
+        self.server.dropped_routes.add('/get_video_info')
+        yt = YouTube(self.server.watch_url('plain'), video_info=True,
+                     retry_policy=RetryPolicy(retries=1, backoff=0))
+        self.assertEqual(len(yt.get_videos()), 4)
+        self.assertEqual(self.server.stats['requests']['/get_video_info'], 2)
+        self.assertEqual(self.server.stats['requests']['/watch'], 1)
+
+    def test_age_restricted(self):
+        with self.assertRaises(AgeRestricted):
+            YouTube(self.server.watch_url('adult'))
+
+    def test_faults(self):
+        self.server.fault_rate = 0.5
+        self.server.faults = ('drop',)
+        yt = YouTube(self.server.watch_url('standin-001'),
+                     retry_policy=RetryPolicy(retries=20, backoff=0))
+        result = yt.select().download(self.path, checksums=['md5'])
+        self.assertEqual(result.checksums['md5'],
+                         hashlib.md5(self.video.content(22)).hexdigest())
+        self.assertTrue(self.server.stats['faults'] > 0)
+
+    def test_load(self):
+        self.server.fault_rate = 0.2
+        urls = [self.server.watch_url('standin-001')]
+        report = run(urls, jobs=6, concurrency=3,
+                     retry_policy=RetryPolicy(retries=10, backoff=0))
+        summary = report.summary()
+        self.assertEqual(summary['jobs'], 6)
+        self.assertEqual(summary['errors'], 0)
+        self.assertEqual(summary['bytes_received'], 6 * 200 * 1024)
+        self.assertTrue(summary['lookup_latency']['p99'] > 0)
+
+    def test_write_behind_under_disk_latency(self):
+        # The throughput gain is measured by the ``pytube.loadtest``
+        # benchmark, here only check the chunks are coalesced into fewer,
+        # larger writes to the slow disk.
+        writes = []
+        open_file = Video._open_file
+
+        def recording_open_file(video, path):
+            fileobj = SlowFile(open_file(video, path), 0.001)
+            write = fileobj.write
+
+            def record(data):
+                writes.append(len(data))
+                return write(data)
+            fileobj.write = record
+            return fileobj
+        urls = [self.server.watch_url('standin-001')]
+        Video._open_file = recording_open_file
+        try:
+            plain = run(urls, jobs=1, concurrency=1, chunk_size=4096)
+            plain_writes, writes[:] = list(writes), []
+            behind = run(urls, jobs=1, concurrency=1, chunk_size=4096,
+                         write_behind={'buffer_size': 64 * 1024})
+        finally:
+            Video._open_file = open_file
+        self.assertEqual(plain.errors, [])
+        self.assertEqual(behind.errors, [])
+        self.assertEqual(behind.bytes_received, plain.bytes_received)
+        self.assertEqual(len(plain_writes), self.video.size // 4096)
+        self.assertEqual(writes, [64 * 1024] * 3 + [8 * 1024])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 50), None)
+
+if __name__ == '__main__':
+    unittest.main()